@@ -24,44 +24,20 @@ Or install globally:
     specify init --here
 """
 
-import sys
-
-import typer
-from rich.align import Align
-from rich.text import Text
-
-from .config import BANNER, TAGLINE
-from .ui import console, show_banner, BannerGroup
-from .commands import init, discover, check, version
 from ._version import __version__
 
-app = typer.Typer(
-    name="specify",
-    help="Setup tool for Specify spec-driven development projects",
-    add_completion=False,
-    invoke_without_command=True,
-    cls=BannerGroup,
-)
-
-
-@app.callback()
-def callback(ctx: typer.Context):
-    """Show banner when no subcommand is provided."""
-    if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
-        show_banner()
-        console.print(Align.center("[dim]Run 'specify --help' for usage information[/dim]"))
-        console.print()
-
 
-# Register commands
-app.command()(init)
-app.command()(discover)
-app.command()(check)
-app.command()(version)
+def __getattr__(name: str):
+    """Build the fully registered CLI app on first access to `specify_cli.app`."""
+    if name == "app":
+        from .cli import build_app
+        return build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
-    app()
+    from .cli import build_app
+    build_app()()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson (the optional ``fast`` extra) parses bytes directly and is several
+times faster than the stdlib; without it these fall back to ``json``.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only need
+to catch the stdlib exception.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+
+def loads(raw: bytes):
+    """Parse JSON from raw bytes (no separate UTF-8 decode step)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps(data) -> bytes:
+    """Serialize data as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def dumps_indented(data) -> bytes:
+    """Serialize data as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
@@ -0,0 +1,51 @@
+"""Typer application for the project-specify CLI.
+
+The application object is created here without any commands attached so that
+importing it only touches Typer. Command modules (which pull in MCP discovery,
+template download, httpx, ...) are registered by `build_app()`.
+"""
+
+import sys
+
+import typer
+from rich.align import Align
+
+from .ui import console, show_banner, BannerGroup
+
+app = typer.Typer(
+    name="specify",
+    help="Setup tool for Specify spec-driven development projects",
+    add_completion=False,
+    invoke_without_command=True,
+    cls=BannerGroup,
+)
+
+_commands_registered = False
+
+
+@app.callback()
+def callback(ctx: typer.Context):
+    """Show banner when no subcommand is provided."""
+    if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
+        show_banner()
+        console.print(Align.center("[dim]Run 'specify --help' for usage information[/dim]"))
+        console.print()
+
+
+def _register_commands(app: typer.Typer) -> None:
+    """Attach all subcommands to the Typer app."""
+    from .commands import init, discover, check, version
+
+    app.command()(init)
+    app.command()(discover)
+    app.command()(check)
+    app.command()(version)
+
+
+def build_app() -> typer.Typer:
+    """Return the CLI app with all commands registered (idempotent)."""
+    global _commands_registered
+    if not _commands_registered:
+        _register_commands(app)
+        _commands_registered = True
+    return app
@@ -2,7 +2,7 @@
 
 from ..config import AGENT_CONFIG
 from ..ui import console, show_banner, StepTracker
-from ..system_tools import check_tool
+from ..system_tools import check_tool, find_executables
 
 
 def check():
@@ -12,8 +12,12 @@ def check():
 
     tracker = StepTracker("Check Available Tools")
 
+    # Resolve every tool with one walk over PATH
+    cli_agents = [key for key, config in AGENT_CONFIG.items() if config["requires_cli"]]
+    path_index = find_executables(["git", *cli_agents, "code", "code-insiders"])
+
     tracker.add("git", "Git version control")
-    git_ok = check_tool("git", tracker=tracker)
+    git_ok = check_tool("git", tracker=tracker, path_index=path_index)
 
     agent_results = {}
     for agent_key, agent_config in AGENT_CONFIG.items():
@@ -23,7 +27,7 @@ def check():
         tracker.add(agent_key, agent_name)
 
         if requires_cli:
-            agent_results[agent_key] = check_tool(agent_key, tracker=tracker)
+            agent_results[agent_key] = check_tool(agent_key, tracker=tracker, path_index=path_index)
         else:
             # IDE-based agent - skip CLI check and mark as optional
             tracker.skip(agent_key, "IDE-based, no CLI check")
@@ -31,10 +35,10 @@ def check():
 
     # Check VS Code variants (not in agent config)
     tracker.add("code", "Visual Studio Code")
-    code_ok = check_tool("code", tracker=tracker)
+    code_ok = check_tool("code", tracker=tracker, path_index=path_index)
 
     tracker.add("code-insiders", "Visual Studio Code Insiders")
-    code_insiders_ok = check_tool("code-insiders", tracker=tracker)
+    code_insiders_ok = check_tool("code-insiders", tracker=tracker, path_index=path_index)
 
     console.print(tracker.render())
 
@@ -1,23 +1,26 @@
 """Init command for project-specify CLI."""
 
+import errno
+import functools
 import os
 import shutil
 import shlex
+import subprocess
 import sys
 from pathlib import Path
 from typing import Optional, List, Set
 from dataclasses import dataclass, field
 
 import typer
+from rich.console import Group
 from rich.panel import Panel
 from rich.live import Live
 
 from ..config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
 from ..ui import console, StepTracker, show_banner, select_with_arrows
 from ..system_tools import check_tool
-from ..git_operations import is_git_repo, init_git_repo
-from ..template_download import ensure_executable_scripts
-from ..errors import SymlinkError, GitOperationError, MCPDiscoveryError
+from ..git_operations import is_git_repo, init_git_repo, start_git_init
+from ..errors import SymlinkError, GitOperationError, MCPDiscoveryError, MonorepoError
 
 
 @dataclass
@@ -25,9 +28,11 @@ class InitializationState:
     """Track created resources for rollback on failure."""
     created_directories: Set[Path] = field(default_factory=set)
     created_symlinks: Set[Path] = field(default_factory=set)
+    created_files: Set[Path] = field(default_factory=set)
     created_git_repo: bool = False
     project_path: Optional[Path] = None
     was_empty_directory: bool = True
+    pending_git_init: Optional[subprocess.Popen] = None
 
     def track_directory(self, path: Path) -> None:
         """Track a directory that was created."""
@@ -39,35 +44,72 @@ class InitializationState:
         if path.exists() or path.is_symlink():
             self.created_symlinks.add(path)
 
+    def track_file(self, path: Path) -> None:
+        """Track a file that was created."""
+        if path.exists():
+            self.created_files.add(path)
+
     def rollback(self, console_obj, verbose: bool = True) -> None:
         """Rollback all created resources on failure."""
+        if self.pending_git_init is not None:
+            # Let a background `git init` finish before deleting under it
+            self.pending_git_init.communicate()
+            self.pending_git_init = None
+
+        removes_project = bool(self.project_path and self.was_empty_directory)
+        if not (
+            self.created_directories or self.created_symlinks
+            or self.created_files or removes_project
+        ):
+            return  # Nothing was created, nothing to undo
+
         if verbose:
             console_obj.print("\n[yellow]Rolling back changes...[/yellow]")
 
         # Remove symlinks first
         for symlink in self.created_symlinks:
             try:
-                if symlink.exists() or symlink.is_symlink():
-                    symlink.unlink()
-                    if verbose:
-                        console_obj.print(f"  [dim]Removed symlink: {symlink}[/dim]")
+                os.unlink(symlink)
+                if verbose:
+                    console_obj.print(f"  [dim]Removed symlink: {symlink}[/dim]")
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 if verbose:
                     console_obj.print(f"  [yellow]Warning: Could not remove {symlink}: {e}[/yellow]")
 
-        # Remove created directories (in reverse order)
-        for directory in sorted(self.created_directories, reverse=True):
+        # Remove created files, e.g. templates copied into an existing .specify
+        for path in self.created_files:
+            try:
+                os.unlink(path)
+                if verbose:
+                    console_obj.print(f"  [dim]Removed file: {path}[/dim]")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                if verbose:
+                    console_obj.print(f"  [yellow]Warning: Could not remove {path}: {e}[/yellow]")
+
+        # Remove created directories, deepest first so children go before parents
+        for directory in sorted(self.created_directories, key=lambda p: len(p.parts), reverse=True):
             try:
-                if directory.exists():
+                try:
+                    # Directories we created are usually empty once symlinks are gone
+                    os.rmdir(directory)
+                except OSError as e:
+                    if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                        raise
                     shutil.rmtree(directory)
-                    if verbose:
-                        console_obj.print(f"  [dim]Removed directory: {directory}[/dim]")
+                if verbose:
+                    console_obj.print(f"  [dim]Removed directory: {directory}[/dim]")
+            except FileNotFoundError:
+                continue  # Already removed along with a tracked parent
             except Exception as e:
                 if verbose:
                     console_obj.print(f"  [yellow]Warning: Could not remove {directory}: {e}[/yellow]")
 
         # Remove project directory if it was empty and we created it
-        if self.project_path and self.was_empty_directory and self.project_path.exists():
+        if removes_project and self.project_path.exists():
             try:
                 shutil.rmtree(self.project_path)
                 if verbose:
@@ -80,6 +122,93 @@ class InitializationState:
             console_obj.print("[yellow]Rollback complete[/yellow]\n")
 
 
+@functools.cache
+def _bundled_project_files() -> tuple:
+    """List the templates and scripts shipped in the package, once per process.
+
+    Returns:
+        Sorted tuple of (path relative to .specify, importlib resource) pairs.
+    """
+    from importlib.resources import files
+
+    root = files("specify_cli")
+    found = []
+    stack = [("templates", root / "templates"), ("scripts", root / "scripts")]
+    while stack:
+        rel, node = stack.pop()
+        if not node.is_dir():
+            continue
+        for child in node.iterdir():
+            child_rel = f"{rel}/{child.name}"
+            if child.is_dir():
+                stack.append((child_rel, child))
+            elif child.name.endswith((".md", ".sh")) and child.name != "README.md":
+                found.append((child_rel, child))
+    return tuple(sorted(found, key=lambda pair: pair[0]))
+
+
+def _install_bundled_files(specify_dir: Path, state: InitializationState) -> int:
+    """Copy bundled templates and scripts into .specify, keeping existing files.
+
+    Files are copied straight from the installed package with the in-kernel
+    copy used for agent commands, without reading them into memory. Every
+    file and directory created is tracked in state for rollback.
+
+    Args:
+        specify_dir: The project's .specify directory.
+        state: Initialization state recording created resources.
+
+    Returns:
+        Number of files copied.
+    """
+    from importlib.resources import as_file
+    from ..symlink_manager import copy_file
+
+    copied = 0
+    for rel, resource in _bundled_project_files():
+        target = specify_dir / rel
+        missing = []
+        parent = target.parent
+        while not parent.is_dir():
+            missing.append(parent)
+            parent = parent.parent
+        for directory in reversed(missing):
+            directory.mkdir(exist_ok=True)
+            state.track_directory(directory)
+        with as_file(resource) as source:
+            # Existing (possibly customized) files are left alone
+            if copy_file(source, target, force=False, verbose=False):
+                state.track_file(target)
+                copied += 1
+    return copied
+
+
+def _inside_git_repo(project_path: Path) -> bool:
+    """Check whether a possibly not-yet-created project path lies in a repo.
+
+    is_git_repo reports False for paths that don't exist, so the check runs
+    on the nearest existing ancestor instead.
+    """
+    existing = project_path
+    while not existing.exists() and existing.parent != existing:
+        existing = existing.parent
+    return is_git_repo(existing)
+
+
+def _discover_mcp(project_path: Path):
+    """Discover MCP servers and project technology without writing anything.
+
+    Args:
+        project_path: Project root to inspect.
+
+    Returns:
+        Tuple of (servers, technology) for generate_mcp_context.
+    """
+    from ..mcp_discovery import discover_mcp_servers, detect_project_technology
+
+    return discover_mcp_servers(project_path), detect_project_technology(project_path)
+
+
 def parse_ai_callback(value: List[str]) -> List[str]:
     """
     Callback to parse --ai values, supporting multiple formats:
@@ -112,6 +241,7 @@ def init(
     workspace: Optional[str] = typer.Option(None, "--workspace", help="Initialize in a specific workspace package (for monorepos)"),
     no_mcp_discovery: bool = typer.Option(False, "--no-mcp-discovery", help="Skip MCP server discovery during initialization"),
     copy: bool = typer.Option(False, "--copy", help="Copy command files instead of creating symlinks (useful on Windows without Developer Mode)"),
+    copy_workers: Optional[int] = typer.Option(None, "--copy-workers", min=1, help="Number of agents to copy in parallel with --copy (default: up to 8)"),
 ):
     """
     Initialize a new project-specify project with symlinked commands.
@@ -161,15 +291,20 @@ def init(
         if not monorepo_type:
             console.print("[yellow]Warning:[/yellow] --workspace specified but no monorepo detected")
         else:
-            packages = get_workspace_packages(Path.cwd(), monorepo_type)
-            # Find matching workspace
-            matching = [p for p in packages if workspace in str(p) or p.name == workspace]
-            if matching:
-                workspace_path = matching[0]
-                console.print(f"[cyan]Monorepo detected:[/cyan] {monorepo_type}")
-                console.print(f"[cyan]Workspace:[/cyan] {workspace_path}")
-            else:
-                console.print(f"[yellow]Warning:[/yellow] Workspace '{workspace}' not found in monorepo")
+            try:
+                packages = get_workspace_packages(Path.cwd(), monorepo_type)
+            except MonorepoError as e:
+                console.print(f"[yellow]Warning:[/yellow] --workspace ignored, could not read workspace packages: {e}")
+                packages = None
+            if packages is not None:
+                # Find matching workspace
+                matching = [p for p in packages if workspace in str(p) or p.name == workspace]
+                if matching:
+                    workspace_path = matching[0]
+                    console.print(f"[cyan]Monorepo detected:[/cyan] {monorepo_type}")
+                    console.print(f"[cyan]Workspace:[/cyan] {workspace_path}")
+                else:
+                    console.print(f"[yellow]Warning:[/yellow] Workspace '{workspace}' not found in monorepo")
 
     if here:
         project_name = Path.cwd().name
@@ -316,9 +451,33 @@ def init(
     # Track git error message outside Live context so it persists
     git_error_message = None
 
+    # Independent read-mostly work overlapped with the symlink/copy phase
+    background = None
+    mcp_future = None
+
     with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
         tracker.attach_refresh(lambda: live.update(tracker.render()))
         try:
+            if (
+                should_init_git
+                and state.was_empty_directory
+                and not _inside_git_repo(project_path)
+            ):
+                # Creating .git doesn't depend on the files added below, so
+                # start it now and reap it at the git step (the commit still
+                # happens last). Only done when rollback would remove the
+                # whole project directory, .git included
+                state.pending_git_init = start_git_init(project_path)
+
+            if not no_mcp_discovery:
+                from concurrent.futures import ThreadPoolExecutor
+
+                # Discovery only reads config files and the project root, so it
+                # can run while agent commands are linked or copied; the
+                # context file is written once .specify/context exists
+                background = ThreadPoolExecutor(max_workers=1)
+                mcp_future = background.submit(_discover_mcp, project_path)
+
             # Import symlink manager
             from ..symlink_manager import (
                 ensure_central_installation,
@@ -337,7 +496,8 @@ def init(
                 selected_agents,
                 force=force,
                 verbose=False,
-                use_copy=copy
+                use_copy=copy,
+                copy_workers=copy_workers,
             )
 
             # Track created symlinks for rollback
@@ -366,40 +526,34 @@ def init(
             tracker.start("specify-dir")
             specify_dir = project_path / ".specify"
 
-            # Track if .specify didn't exist before
-            created_specify = not specify_dir.exists()
-            specify_dir.mkdir(exist_ok=True)
-            if created_specify:
-                state.track_directory(specify_dir)
-
-            # Create subdirectories and track them
-            for subdir_name in ["memory", "specs", "scripts", "templates", "context"]:
-                subdir = specify_dir / subdir_name
-                created_subdir = not subdir.exists()
-                subdir.mkdir(exist_ok=True)
-                if created_subdir:
-                    state.track_directory(subdir)
+            # Create .specify and its subdirectories, tracking only the ones
+            # that didn't exist before. A bare mkdir both creates and tells us
+            # whether the directory was already there. Agent setup normally
+            # creates the project directory, but it may have written nothing
+            project_path.mkdir(parents=True, exist_ok=True)
+            for subdir in [specify_dir] + [
+                specify_dir / name for name in ("memory", "specs", "scripts", "templates", "context")
+            ]:
+                try:
+                    os.mkdir(subdir)
+                except FileExistsError:
+                    continue
+                state.created_directories.add(subdir)
 
-            # Copy scripts from package (these are project-specific)
-            # TODO: In Phase 2, we'll copy scripts from package resources
-            # For now, just create the structure
+            # Copy templates and scripts from package (these are project-specific)
+            installed = _install_bundled_files(specify_dir, state)
 
-            tracker.complete("specify-dir", "project structure created")
+            tracker.complete("specify-dir", f"project structure created, {installed} file(s) added")
 
             # MCP discovery (optional)
             if not no_mcp_discovery:
                 try:
-                    from ..mcp_discovery import (
-                        discover_mcp_servers,
-                        detect_project_technology,
-                        generate_mcp_context,
-                    )
+                    from ..mcp_discovery import generate_mcp_context
 
                     tracker.add("mcp-discovery", "Discover MCP servers")
                     tracker.start("mcp-discovery")
 
-                    servers = discover_mcp_servers(project_path)
-                    tech = detect_project_technology(project_path)
+                    servers, tech = mcp_future.result()
                     generate_mcp_context(project_path, servers, tech)
 
                     tracker.complete("mcp-discovery", f"{len(servers)} server(s) found")
@@ -409,14 +563,21 @@ def init(
                 except Exception as e:
                     tracker.skip("mcp-discovery", f"skipped: {e}")
 
+            # Imported here: template_download pulls in httpx, which only
+            # init's actual work (not CLI startup or --help) needs
+            from ..template_download import ensure_executable_scripts
+
             ensure_executable_scripts(project_path, tracker=tracker)
 
             if not no_git:
                 tracker.start("git")
-                if is_git_repo(project_path):
+                git_init_process, state.pending_git_init = state.pending_git_init, None
+                if git_init_process is None and is_git_repo(project_path):
                     tracker.complete("git", "existing repo detected")
                 elif should_init_git:
-                    success, error_msg = init_git_repo(project_path, quiet=True)
+                    success, error_msg = init_git_repo(
+                        project_path, quiet=True, init_process=git_init_process
+                    )
                     if success:
                         state.created_git_repo = True
                         tracker.complete("git", "initialized")
@@ -502,14 +663,17 @@ def init(
             state.rollback(console, verbose=debug)
             raise typer.Exit(1)
         finally:
-            pass
+            if background is not None:
+                background.shutdown(wait=False, cancel_futures=True)
+            if state.pending_git_init is not None:
+                state.pending_git_init.communicate()
 
-    console.print(tracker.render())
-    console.print("\n[bold green]Project ready.[/bold green]")
+    # Collect the closing summary and print it once, so Rich lays the section
+    # out in a single pass and writes it in one go
+    summary = [tracker.render(), "\n[bold green]Project ready.[/bold green]"]
 
     # Show git error details if initialization failed
     if git_error_message:
-        console.print()
         git_error_panel = Panel(
             f"[yellow]Warning:[/yellow] Git repository initialization failed\n\n"
             f"{git_error_message}\n\n"
@@ -522,7 +686,7 @@ def init(
             border_style="red",
             padding=(1, 2)
         )
-        console.print(git_error_panel)
+        summary += ["", git_error_panel]
 
     # Agent folder security notice
     agent_folders = set()
@@ -540,8 +704,7 @@ def init(
             border_style="yellow",
             padding=(1, 2)
         )
-        console.print()
-        console.print(security_notice)
+        summary += ["", security_notice]
 
     steps_lines = []
     if not here:
@@ -572,8 +735,7 @@ def init(
     steps_lines.append("   2.5 [cyan]/speckit.implement[/] - Execute implementation")
 
     steps_panel = Panel("\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1,2))
-    console.print()
-    console.print(steps_panel)
+    summary += ["", steps_panel]
 
     enhancement_lines = [
         "Optional commands that you can use for your specs [bright_black](improve quality & confidence)[/bright_black]",
@@ -583,5 +745,5 @@ def init(
         f"○ [cyan]/speckit.checklist[/] [bright_black](optional)[/bright_black] - Generate quality checklists to validate requirements completeness, clarity, and consistency (after [cyan]/speckit.plan[/])"
     ]
     enhancements_panel = Panel("\n".join(enhancement_lines), title="Enhancement Commands", border_style="cyan", padding=(1,2))
-    console.print()
-    console.print(enhancements_panel)
+    summary += ["", enhancements_panel]
+    console.print(Group(*summary))
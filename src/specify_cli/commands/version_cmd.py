@@ -1,16 +1,13 @@
 """Version command for project-specify CLI."""
 
 import platform
-import importlib.metadata
 from pathlib import Path
 from datetime import datetime
 
-import httpx
 from rich.table import Table
 from rich.panel import Panel
 
 from ..ui import console, show_banner
-from ..github_api import github_auth_headers, ssl_context
 
 
 def version():
@@ -18,6 +15,8 @@ def version():
     show_banner()
 
     # Get CLI version from package metadata
+    import importlib.metadata
+
     cli_version = "unknown"
     try:
         cli_version = importlib.metadata.version("specify-cli")
@@ -41,16 +40,19 @@ def version():
     template_version = "unknown"
     release_date = "unknown"
 
+    # httpx/truststore are only needed here; keep them off the CLI's import path
+    from .._jsonio import loads as json_loads
+    from ..github_api import github_auth_headers, get_client
+
     try:
-        client = httpx.Client(verify=ssl_context)
-        response = client.get(
+        response = get_client().get(
             api_url,
             timeout=10,
             follow_redirects=True,
             headers=github_auth_headers(),
         )
         if response.status_code == 200:
-            release_data = response.json()
+            release_data = json_loads(response.content)
             template_version = release_data.get("tag_name", "unknown")
             # Remove 'v' prefix if present
             if template_version.startswith("v"):
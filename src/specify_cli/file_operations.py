@@ -1,9 +1,11 @@
 """File operation utilities for project-specify."""
 
 import json
+import os
 import shutil
 from pathlib import Path
 
+from ._jsonio import loads as json_loads
 from .errors import FileOperationError
 
 
@@ -24,15 +26,16 @@ def handle_vscode_settings(sub_item: Path, dest_file: Path, rel_path: str, verbo
             console.print(f"[{color}]{message}[/] {rel_path}")
 
     try:
-        with open(sub_item, 'r', encoding='utf-8') as f:
-            new_settings = json.load(f)
+        new_settings = json_loads(sub_item.read_bytes())
 
         if dest_file.exists():
             merged = merge_json_files(dest_file, new_settings, verbose=verbose and not tracker)
-            with open(dest_file, 'w', encoding='utf-8') as f:
-                json.dump(merged, f, indent=4)
-                f.write('\n')
-            log("Merged:", "green")
+            merged_bytes = (json.dumps(merged, indent=4) + '\n').encode('utf-8')
+            if dest_file.read_bytes() == merged_bytes:
+                log("Unchanged:", "green")
+            else:
+                _replace_file_bytes(dest_file, merged_bytes)
+                log("Merged:", "green")
         else:
             shutil.copy2(sub_item, dest_file)
             log("Copied (no existing settings.json):", "blue")
@@ -55,13 +58,50 @@ def handle_vscode_settings(sub_item: Path, dest_file: Path, rel_path: str, verbo
             ) from copy_err
 
 
+def _replace_file_bytes(path: Path, data: bytes) -> None:
+    """Atomically replace a file's contents, keeping its permission bits.
+
+    The data goes to a temporary file in the same directory, which is then
+    renamed over path, so readers never see a half-written file.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _deep_merge_into(base: dict, update: dict) -> dict:
+    """Deep-merge update into base in place and return base.
+
+    Nested dictionaries present on both sides are merged; any other value in
+    update replaces the one in base. Uses an explicit stack, so arbitrarily
+    deep settings never hit the recursion limit. Dictionaries from update are
+    never modified.
+    """
+    stack = [(base, update)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return base
+
+
 def merge_json_files(existing_path: Path, new_content: dict | Path, verbose: bool = False) -> dict:
     """Merge new JSON content into existing JSON file.
 
     Performs a deep merge where:
     - New keys are added
     - Existing keys are preserved unless overwritten by new content
-    - Nested dictionaries are merged recursively
+    - Nested dictionaries are merged recursively (the freshly loaded
+      existing content is updated in place, no intermediate copies)
     - Lists and other values are replaced (not merged)
 
     Args:
@@ -72,43 +112,31 @@ def merge_json_files(existing_path: Path, new_content: dict | Path, verbose: boo
     Returns:
         Merged JSON content as dict.
     """
-    from .ui import console  # Import here to avoid circular dependency
-
-    # Load new_content from file if it's a Path
-    if isinstance(new_content, Path):
-        try:
-            with open(new_content, 'r', encoding='utf-8') as f:
-                new_content = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # If new content file doesn't exist or is invalid, return existing or empty
-            try:
-                with open(existing_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                return {}
+    # Hot path: both sides load as JSON and are merged in place. Missing or
+    # invalid files fall through to the cheaper fallbacks below
+    try:
+        if isinstance(new_content, Path):
+            new_content = json_loads(new_content.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
+        # If new content file doesn't exist or is invalid, return existing or empty
+        return _load_json_or_empty(existing_path)
 
     try:
-        with open(existing_path, 'r', encoding='utf-8') as f:
-            existing_content = json.load(f)
+        merged = _deep_merge_into(json_loads(existing_path.read_bytes()), new_content)
     except (FileNotFoundError, json.JSONDecodeError):
         # If file doesn't exist or is invalid, just use new content
         return new_content
 
-    def deep_merge(base: dict, update: dict) -> dict:
-        """Recursively merge update dict into base dict."""
-        result = base.copy()
-        for key, value in update.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                result[key] = deep_merge(result[key], value)
-            else:
-                # Add new key or replace existing value
-                result[key] = value
-        return result
-
-    merged = deep_merge(existing_content, new_content)
-
     if verbose:
+        from .ui import console  # Import here to avoid circular dependency
         console.print(f"[cyan]Merged JSON file:[/cyan] {existing_path.name}")
 
     return merged
+
+
+def _load_json_or_empty(path: Path) -> dict:
+    """Load a JSON file, or return an empty dict if it is missing or invalid."""
+    try:
+        return json_loads(path.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
@@ -1,10 +1,49 @@
 """Git repository operations."""
 
+import functools
 import os
+import stat
 import subprocess
 from pathlib import Path
 from typing import Tuple, Optional
 
+try:
+    import pygit2
+    _Pygit2Error = pygit2.GitError
+except ImportError:  # Optional: fall back to the git CLI
+    pygit2 = None
+    _Pygit2Error = ()  # Matches no exception
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_git_root(path_str: str) -> Optional[str]:
+    """Walk up from a resolved path looking for a `.git` entry.
+
+    A `.git` directory marks a regular repository; a `.git` file marks a
+    worktree or submodule. Each level costs a single `stat` call. Results are
+    memoized per path string; call `is_git_repo.cache_clear()` after creating
+    or removing repositories.
+
+    Args:
+        path_str: Resolved directory path as a string.
+
+    Returns:
+        The repository root as a string, or None if not inside a repository.
+    """
+    current = path_str
+    while True:
+        try:
+            mode = os.stat(os.path.join(current, ".git")).st_mode
+        except OSError:
+            pass
+        else:
+            if stat.S_ISDIR(mode) or stat.S_ISREG(mode):
+                return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
 
 def is_git_repo(path: Path = None) -> bool:
     """Check if the specified path is inside a git repository.
@@ -15,31 +54,150 @@ def is_git_repo(path: Path = None) -> bool:
     Returns:
         True if path is inside a git repository, False otherwise.
     """
-    if path is None:
-        path = Path.cwd()
+    path_str = os.getcwd() if path is None else os.fspath(path)
 
-    if not path.is_dir():
+    if not os.path.isdir(path_str):
         return False
 
+    return _find_git_root(os.path.realpath(path_str)) is not None
+
+
+is_git_repo.cache_clear = _find_git_root.cache_clear
+
+
+# Identity used for the initial commit only when git has none configured
+_FALLBACK_NAME = "Specify"
+_FALLBACK_EMAIL = "specify@local"
+_FALLBACK_IDENTITY = ["-c", f"user.name={_FALLBACK_NAME}", "-c", f"user.email={_FALLBACK_EMAIL}"]
+_INITIAL_COMMIT_MESSAGE = "Initial commit from Specify template"
+
+
+def _init_git_repo_pygit2(project_path: Path) -> None:
+    """Initialize a repository and create the initial commit in-process.
+
+    Raises:
+        pygit2.GitError: If libgit2 fails to create the repository or commit.
+    """
+    repo = pygit2.init_repository(str(project_path))
+    try:
+        signature = repo.default_signature
+    except (KeyError, pygit2.GitError):
+        signature = pygit2.Signature(_FALLBACK_NAME, _FALLBACK_EMAIL)
+
+    index = repo.index
+    index.add_all()
+    index.write()
+    tree = index.write_tree()
+    repo.create_commit("HEAD", signature, signature, _INITIAL_COMMIT_MESSAGE, tree, [])
+
+
+def _run_git(
+    git: list[str], *args: str, env: Optional[dict[str, str]] = None
+) -> subprocess.CompletedProcess:
+    """Run a git command, capturing output and raising on failure.
+
+    ``close_fds=False`` lets CPython use its ``posix_spawn`` fast path on POSIX.
+    This is safe because Python-created descriptors are non-inheritable by
+    default (PEP 446), so git still only sees stdio.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero.
+        FileNotFoundError: If git is not installed.
+    """
+    return subprocess.run(
+        [*git, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        close_fds=False,
+        env=env,
+    )
+
+
+def start_git_init(project_path: Path) -> Optional[subprocess.Popen]:
+    """Start `git init` in the background so it overlaps other setup work.
+
+    Pass the result to `init_git_repo(init_process=...)`, which waits for it
+    and then creates the initial commit. Only the CLI backend benefits: with
+    pygit2 the in-process init is already cheap, so nothing is started.
+
+    Args:
+        project_path: Directory to initialize; created if missing.
+
+    Returns:
+        The running process, or None if init_git_repo should do the init itself.
+    """
+    if pygit2 is not None:
+        return None
     try:
-        # Use git command to check if inside a work tree
-        subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            check=True,
-            capture_output=True,
-            cwd=path,
+        return subprocess.Popen(
+            ["git", "init", "--quiet", str(project_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            close_fds=False,
+        )
+    except OSError:
+        return None  # init_git_repo reports the failure
+
+
+def _wait_git_init(init_process: subprocess.Popen) -> None:
+    """Wait for a background `git init`, raising if it failed.
+
+    Raises:
+        subprocess.CalledProcessError: If git exited non-zero.
+    """
+    _, stderr = init_process.communicate()
+    if init_process.returncode:
+        raise subprocess.CalledProcessError(
+            init_process.returncode, init_process.args, stderr=stderr
         )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
 
 
-def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Optional[str]]:
+def _init_git_repo_cli(
+    project_path: Path, init_process: Optional[subprocess.Popen] = None
+) -> None:
+    """Initialize a repository and create the initial commit with the git CLI.
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails.
+        FileNotFoundError: If git is not installed.
+    """
+    git = ["git", "-C", str(project_path)]
+    commit = ["commit", "-m", _INITIAL_COMMIT_MESSAGE]
+
+    if init_process is None:
+        _run_git(git, "init", "--quiet")
+    else:
+        _wait_git_init(init_process)
+    _run_git(git, "add", ".")
+    # Force untranslated messages so the identity check below holds under
+    # any user locale.
+    commit_env = {**os.environ, "LC_ALL": "C"}
+    try:
+        _run_git(git, *commit, env=commit_env)
+    except subprocess.CalledProcessError as e:
+        # No user.name/user.email configured: retry with an inline identity
+        # rather than spawning extra `git config` processes up front.
+        if "ident" not in (e.stderr or "").lower():
+            raise
+        _run_git(git, *_FALLBACK_IDENTITY, *commit, env=commit_env)
+
+
+def init_git_repo(
+    project_path: Path,
+    quiet: bool = False,
+    init_process: Optional[subprocess.Popen] = None,
+) -> Tuple[bool, Optional[str]]:
     """Initialize a git repository in the specified path.
 
+    Uses pygit2 in-process when it is installed, otherwise the git CLI.
+
     Args:
         project_path: Path to initialize git repository in.
         quiet: If True, suppress console output (tracker handles status).
+        init_process: A `git init` already running from `start_git_init`;
+            it is waited for instead of running the init step again.
 
     Returns:
         Tuple of (success: bool, error_message: Optional[str]).
@@ -47,18 +205,12 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
     from .ui import console  # Import here to avoid circular dependency
 
     try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
         if not quiet:
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit from Specify template"],
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        if pygit2 is not None:
+            _init_git_repo_pygit2(project_path)
+        else:
+            _init_git_repo_cli(project_path, init_process)
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True, None
@@ -78,5 +230,11 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         if not quiet:
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False, error_msg
+    except _Pygit2Error as e:
+        error_msg = f"libgit2 error: {e}"
+        if not quiet:
+            console.print(f"[red]Error initializing git repository:[/red] {e}")
+        return False, error_msg
     finally:
-        os.chdir(original_cwd)
+        # A new .git directory invalidates any cached negative lookups
+        _find_git_root.cache_clear()
@@ -1,5 +1,6 @@
 """GitHub API utilities for project-specify."""
 
+import functools
 import os
 import ssl
 import httpx
@@ -8,7 +9,32 @@ from datetime import datetime, timezone
 
 # Set up SSL context with truststore for GitHub API
 ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+
+
+@functools.cache
+def get_client() -> httpx.Client:
+    """Return the shared HTTP client for GitHub requests.
+
+    One pooled client keeps connections alive across the release lookup and
+    asset download (and any later calls in the same process), so each host
+    costs a single TCP+TLS handshake. Connection failures are retried.
+
+    Returns:
+        Process-wide httpx client.
+    """
+    transport = httpx.HTTPTransport(
+        verify=ssl_context,
+        retries=3,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+    )
+    return httpx.Client(transport=transport)
+
+
+def __getattr__(name: str):
+    """Create the shared `client` lazily on first access."""
+    if name == "client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def github_token(cli_token: str | None = None) -> str | None:
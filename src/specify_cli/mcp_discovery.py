@@ -7,17 +7,21 @@ and generates context files that commands can reference.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import platform
-from dataclasses import dataclass, field, asdict
+import re
+from dataclasses import dataclass, field, asdict, replace
+from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
+from ._jsonio import dumps_indented as _json_dumps_indented, loads as _json_loads
 from .errors import MCPDiscoveryError
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPServer:
     """Represents a discovered MCP server."""
     name: str
@@ -29,7 +33,7 @@ class MCPServer:
     capabilities: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectTechnology:
     """Detected project technology stack."""
     primary_language: str
@@ -76,11 +80,31 @@ KNOWN_MCP_SERVERS = {
     },
 }
 
+# Fallback for servers missing from KNOWN_MCP_SERVERS
+_UNKNOWN_SERVER_INFO = {"description": "", "capabilities": []}
+
 
 def get_mcp_config_paths() -> dict[str, Path]:
     """Get paths to MCP configuration files for various tools."""
-    system = platform.system()
-    home = Path.home()
+    return dict(_mcp_config_paths())
+
+
+def _mcp_config_paths() -> MappingProxyType[str, Path]:
+    """Return the cached, read-only MCP config path mapping for this environment."""
+    return _get_mcp_config_paths_impl(
+        platform.system(),
+        os.environ.get("APPDATA", ""),
+        os.environ.get("XDG_CONFIG_HOME", ""),
+        os.path.expanduser("~"),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_mcp_config_paths_impl(
+    system: str, appdata: str, xdg_config_home: str, home: str
+) -> MappingProxyType[str, Path]:
+    """Build MCP config paths from the platform and environment (memoized)."""
+    home = Path(home)
     
     paths = {}
     
@@ -89,55 +113,99 @@ def get_mcp_config_paths() -> dict[str, Path]:
         paths["claude_code"] = home / ".claude/mcp_servers.json"
         paths["cursor"] = home / ".cursor/mcp.json"
     elif system == "Windows":
-        appdata = Path(os.environ.get("APPDATA", home / "AppData/Roaming"))
+        appdata = Path(appdata) if appdata else home / "AppData/Roaming"
         paths["claude_desktop"] = appdata / "Claude/claude_desktop_config.json"
         paths["claude_code"] = home / ".claude/mcp_servers.json"
         paths["cursor"] = appdata / "Cursor/mcp.json"
     else:  # Linux
-        config_home = Path(os.environ.get("XDG_CONFIG_HOME", home / ".config"))
+        config_home = Path(xdg_config_home) if xdg_config_home else home / ".config"
         paths["claude_desktop"] = config_home / "Claude/claude_desktop_config.json"
         paths["claude_code"] = home / ".claude/mcp_servers.json"
         paths["cursor"] = config_home / "cursor/mcp.json"
     
-    return paths
+    # Read-only so no caller can corrupt the cached mapping
+    return MappingProxyType(paths)
+
+
+# Project-local MCP config files, relative to the project root
+_PROJECT_MCP_CONFIGS = (".mcp/servers.json", "mcp.json", ".mcp.json")
 
 
 def discover_mcp_servers(project_dir: Optional[Path] = None) -> list[MCPServer]:
-    """Discover all available MCP servers from various sources."""
+    """Discover all available MCP servers from various sources.
+
+    Results are memoized per set of candidate config files. The cache key
+    includes each file's mtime, so creating, editing or deleting a config
+    invalidates the cached result. Call `discover_mcp_servers.cache_clear()`
+    to drop all cached results.
+    """
     if project_dir is None:
         project_dir = Path.cwd()
     
-    servers = []
-    
-    config_paths = get_mcp_config_paths()
+    config_paths = _mcp_config_paths()
     
-    for source, path in config_paths.items():
-        if path.exists():
-            try:
-                servers.extend(_parse_mcp_config(path, source))
-            except Exception as e:
-                # Log but don't fail - a single corrupted config shouldn't break discovery
-                import logging
-                logging.debug(f"Failed to parse MCP config from {source}: {e}")
+    candidates = [(path, source) for source, path in config_paths.items()]
+    candidates += [(project_dir / name, "project") for name in _PROJECT_MCP_CONFIGS]
+    candidates = tuple(candidates)
     
-    # Check for project-local MCP config
-    local_configs = [
-        project_dir / ".mcp/servers.json",
-        project_dir / "mcp.json",
-        project_dir / ".mcp.json",
+    stamp = tuple(_mtime_ns(os.fspath(path)) for path, _ in candidates)
+    # Hand out private containers so callers can't corrupt the cache
+    return [
+        replace(
+            server,
+            args=list(server.args),
+            env=dict(server.env),
+            capabilities=list(server.capabilities),
+        )
+        for server in _discover_mcp_servers_cached(candidates, stamp)
     ]
+
+
+@functools.lru_cache(maxsize=16)
+def _discover_mcp_servers_cached(
+    candidates: tuple[tuple[Path, str], ...], stamp: tuple[int, ...]
+) -> tuple[MCPServer, ...]:
+    """Parse and deduplicate the candidate MCP configs (memoized on mtimes)."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Reads are independent and I/O bound. No existence probe first: opening a
+    # missing file fails just as cheaply, and _parse_mcp_config_safe skips it
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        results = list(ex.map(lambda c: _parse_mcp_config_safe(*c), candidates))
     
-    for config_path in local_configs:
-        if config_path.exists():
-            try:
-                servers.extend(_parse_mcp_config(config_path, "project"))
-            except Exception as e:
-                # Project-local config errors should be visible
-                import logging
-                logging.warning(f"Failed to parse project MCP config at {config_path}: {e}")
+    servers = [server for result in results for server in result]
     
     # Deduplicate by name, preferring project > claude_code > claude_desktop > others
-    return _deduplicate_servers(servers)
+    return tuple(_deduplicate_servers(servers))
+
+
+discover_mcp_servers.cache_clear = _discover_mcp_servers_cached.cache_clear
+
+
+def _parse_mcp_config_safe(path: Path, source: str) -> list[MCPServer]:
+    """Parse an MCP configuration file, logging failures instead of raising.
+
+    Args:
+        path: Path to MCP configuration file.
+        source: Source identifier (e.g., "claude_desktop", "project").
+
+    Returns:
+        List of discovered MCP servers, or an empty list if parsing failed.
+    """
+    try:
+        return _parse_mcp_config(path, source)
+    except Exception as e:
+        if isinstance(e.__cause__, (FileNotFoundError, NotADirectoryError)):
+            # Absent configs are the common case, not an error
+            return []
+        import logging
+        if source == "project":
+            # Project-local config errors should be visible
+            logging.warning(f"Failed to parse project MCP config at {path}: {e}")
+        else:
+            # Log but don't fail - a single corrupted config shouldn't break discovery
+            logging.debug(f"Failed to parse MCP config from {source}: {e}")
+        return []
 
 
 def _parse_mcp_config(path: Path, source: str) -> list[MCPServer]:
@@ -156,15 +224,25 @@ def _parse_mcp_config(path: Path, source: str) -> list[MCPServer]:
     servers = []
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = path.read_bytes()
+    except OSError as e:
+        raise MCPDiscoveryError(
+            f"Failed to read {source} MCP config at {path}: {e}"
+        ) from e
+
+    if not raw.strip():
+        # An empty placeholder config declares no servers; it isn't malformed
+        return servers
+
+    try:
+        data = _json_loads(raw)
     except json.JSONDecodeError as e:
         raise MCPDiscoveryError(
             f"Invalid JSON in {source} MCP config at {path}: {e}"
         ) from e
-    except Exception as e:
+    except UnicodeDecodeError as e:
         raise MCPDiscoveryError(
-            f"Failed to read {source} MCP config at {path}: {e}"
+            f"Failed to decode {source} MCP config at {path}: {e}"
         ) from e
     
     # Handle different config formats
@@ -177,7 +255,7 @@ def _parse_mcp_config(path: Path, source: str) -> list[MCPServer]:
             env = config.get("env", {})
             
             # Look up known server info
-            known_info = KNOWN_MCP_SERVERS.get(name, {})
+            known_info = KNOWN_MCP_SERVERS.get(name, _UNKNOWN_SERVER_INFO)
             
             server = MCPServer(
                 name=name,
@@ -185,127 +263,281 @@ def _parse_mcp_config(path: Path, source: str) -> list[MCPServer]:
                 args=args if isinstance(args, list) else [],
                 env=env if isinstance(env, dict) else {},
                 source=source,
-                description=known_info.get("description", ""),
-                capabilities=known_info.get("capabilities", []),
+                description=known_info["description"],
+                # Copy so servers never share (or mutate) the catalog's list
+                capabilities=list(known_info["capabilities"]),
             )
             servers.append(server)
     
     return servers
 
 
+# Lower value wins; unknown sources rank last
+_SOURCE_PRIORITY = {
+    "project": 0,
+    "claude_code": 1,
+    "claude_desktop": 2,
+    "cursor": 3,
+}
+
+
 def _deduplicate_servers(servers: list[MCPServer]) -> list[MCPServer]:
     """Deduplicate servers by name, preferring higher-priority sources."""
-    source_priority = {
-        "project": 0,
-        "claude_code": 1,
-        "claude_desktop": 2,
-        "cursor": 3,
-    }
-    
-    seen = {}
+    best: dict[str, tuple[int, MCPServer]] = {}
     for server in servers:
-        name = server.name
-        priority = source_priority.get(server.source, 99)
-        
-        if name not in seen or priority < source_priority.get(seen[name].source, 99):
-            seen[name] = server
+        priority = _SOURCE_PRIORITY.get(server.source, 99)
+        current = best.get(server.name)
+        if current is None or priority < current[0]:
+            best[server.name] = (priority, server)
     
-    return list(seen.values())
+    return [server for _, server in best.values()]
+
+
+# Files whose contents (not just presence) feed technology detection
+_TECH_CONTENT_FILES = (
+    "package.json",
+    "pyproject.toml",
+    "Cargo.toml",
+    "docker-compose.yml",
+    "docker-compose.yaml",
+    ".github/workflows",
+)
+
+# Dependency name -> framework, in priority order (meta-frameworks first)
+_JS_FRAMEWORKS = {
+    "next": "nextjs",
+    "@nestjs/core": "nestjs",
+    "react": "react",
+    "vue": "vue",
+    "svelte": "svelte",
+    "express": "express",
+}
+_PY_FRAMEWORKS = {
+    "django": "django",
+    "flask": "flask",
+    "fastapi": "fastapi",
+}
+
+# Top-level names that mark a Python or Java project, or Kubernetes manifests
+_PYTHON_MARKERS = frozenset({"pyproject.toml", "requirements.txt", "Pipfile"})
+_JAVA_MARKERS = frozenset({"pom.xml", "build.gradle"})
+_K8S_DIRS = frozenset({"k8s", "kubernetes"})
+
+# docker-compose image keyword -> database name
+_COMPOSE_DATABASES = {
+    "postgres": "postgresql",
+    "mysql": "mysql",
+    "mongodb": "mongodb",
+}
+
+# One case-insensitive pass over an image name finds any known keyword
+_COMPOSE_IMAGE_PATTERN = re.compile(
+    "|".join(re.escape(kw) for kw in (*_COMPOSE_DATABASES, "redis")),
+    re.IGNORECASE,
+)
+
+# Leading distribution name of a PEP 508 requirement string
+_REQUIREMENT_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+def _mtime_ns(path: str) -> int:
+    """Return a path's mtime in nanoseconds, or 0 if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _match_framework(frameworks: dict[str, str], *dep_tables) -> Optional[str]:
+    """Return the highest-priority framework whose package is in any dep table."""
+    return next(
+        (name for dep, name in frameworks.items() if any(dep in table for table in dep_tables)),
+        None,
+    )
+
+
+def _python_dependency_names(pyproject: dict) -> set[str]:
+    """Collect lowercased dependency names declared in a parsed pyproject.toml.
+
+    Covers PEP 621 ``[project]`` dependencies and optional dependencies as
+    well as Poetry's main, dev and group dependency tables.
+
+    Args:
+        pyproject: Parsed pyproject.toml data.
+
+    Returns:
+        Set of normalized dependency names.
+    """
+    names = set()
+
+    project = pyproject.get("project", {})
+    requirements = list(project.get("dependencies", []))
+    for extra in project.get("optional-dependencies", {}).values():
+        requirements.extend(extra)
+    for requirement in requirements:
+        match = _REQUIREMENT_NAME.match(requirement)
+        if match:
+            names.add(match.group(0).lower())
+
+    poetry = pyproject.get("tool", {}).get("poetry", {})
+    tables = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+    tables += [group.get("dependencies", {}) for group in poetry.get("group", {}).values()]
+    for table in tables:
+        names.update(name.lower() for name in table)
+
+    return names
+
+
+def _has_workflow_file(workflows_dir: Path) -> bool:
+    """Check whether a directory holds at least one YAML workflow file.
+
+    Stops at the first match; ``DirEntry.is_file(follow_symlinks=False)``
+    answers from the directory listing without an extra stat.
+
+    Args:
+        workflows_dir: Path to a ``.github/workflows`` directory.
+
+    Returns:
+        True if a ``.yml`` or ``.yaml`` file is present, False otherwise.
+    """
+    try:
+        with os.scandir(workflows_dir) as it:
+            return any(
+                entry.name.endswith((".yml", ".yaml")) and entry.is_file(follow_symlinks=False)
+                for entry in it
+            )
+    except OSError:
+        return False
 
 
 def detect_project_technology(project_dir: Path) -> ProjectTechnology:
-    """Detect the project's technology stack."""
+    """Detect the project's technology stack.
+
+    Results are memoized per directory. The cache key includes the mtime of
+    the directory itself (files added or removed) and of each file whose
+    contents are inspected, so edits invalidate the cached result. Call
+    `detect_project_technology.cache_clear()` to drop all cached results.
+
+    Args:
+        project_dir: Project root directory.
+
+    Returns:
+        Detected project technology stack.
+    """
+    path_str = os.path.realpath(project_dir)
+    stamp = tuple(
+        _mtime_ns(os.path.join(path_str, name))
+        for name in _TECH_CONTENT_FILES
+    )
+    tech = _detect_project_technology_cached(path_str, _mtime_ns(path_str), stamp)
+    # Hand out a private services list so callers can't corrupt the cache
+    return replace(tech, detected_services=list(tech.detected_services))
+
+
+@functools.lru_cache(maxsize=64)
+def _detect_project_technology_cached(
+    path_str: str, dir_mtime_ns: int, stamp: tuple[int, ...]
+) -> ProjectTechnology:
+    """Detect the project's technology stack (memoized on mtimes)."""
+    project_dir = Path(path_str)
     primary_language = "unknown"
     framework = None
     package_manager = None
     database = None
     detected_services = []
     
+    # One directory listing answers every top-level presence check below.
+    # Entry types come from the listing too, so telling directories apart
+    # costs no extra stat
+    names = set()
+    dirs = set()
+    try:
+        with os.scandir(path_str) as it:
+            for entry in it:
+                names.add(entry.name)
+                if entry.is_dir():
+                    dirs.add(entry.name)
+    except OSError:
+        pass
+    
     # Detect language
-    if (project_dir / "package.json").exists():
-        primary_language = "typescript" if (project_dir / "tsconfig.json").exists() else "nodejs"
+    if "package.json" in names:
+        primary_language = "typescript" if "tsconfig.json" in names else "nodejs"
         package_manager = "npm"
-        if (project_dir / "yarn.lock").exists():
+        if "yarn.lock" in names:
             package_manager = "yarn"
-        elif (project_dir / "pnpm-lock.yaml").exists():
+        elif "pnpm-lock.yaml" in names:
             package_manager = "pnpm"
         
-        # Detect framework
+        # Detect framework. Monorepo detection reads package.json again
+        # below; loading through its stat-keyed cache parses the file once
+        from .monorepo import _load_json
         try:
-            with open(project_dir / "package.json", "r", encoding="utf-8") as f:
-                pkg_data = json.load(f)
-                deps = {**pkg_data.get("dependencies", {}), **pkg_data.get("devDependencies", {})}
-                if "next" in deps:
-                    framework = "nextjs"
-                elif "react" in deps:
-                    framework = "react"
-                elif "vue" in deps:
-                    framework = "vue"
-                elif "express" in deps:
-                    framework = "express"
-        except (json.JSONDecodeError, FileNotFoundError, KeyError):
+            pkg_data = _load_json(project_dir / "package.json")
+            # Look names up in both tables rather than merging them
+            framework = _match_framework(
+                _JS_FRAMEWORKS,
+                pkg_data.get("dependencies") or {},
+                pkg_data.get("devDependencies") or {},
+            )
+        except (OSError, ValueError, KeyError):
             # Silently skip framework detection if package.json is invalid
             pass
-    elif (project_dir / "Cargo.toml").exists():
+    elif "Cargo.toml" in names:
         primary_language = "rust"
-    elif (project_dir / "go.mod").exists():
+    elif "go.mod" in names:
         primary_language = "go"
-    elif (project_dir / "pyproject.toml").exists() or (project_dir / "requirements.txt").exists() or (project_dir / "Pipfile").exists():
+    elif not _PYTHON_MARKERS.isdisjoint(names):
         primary_language = "python"
         package_manager = "pip"
-        if (project_dir / "Pipfile").exists():
+        if "Pipfile" in names:
             package_manager = "pipenv"
-        elif (project_dir / "poetry.lock").exists():
+        elif "poetry.lock" in names:
             package_manager = "poetry"
         
         # Detect framework
+        import tomllib
         try:
-            if (project_dir / "pyproject.toml").exists():
-                content = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
-                if "django" in content.lower():
-                    framework = "django"
-                elif "flask" in content.lower():
-                    framework = "flask"
-                elif "fastapi" in content.lower():
-                    framework = "fastapi"
-        except (FileNotFoundError, UnicodeDecodeError):
-            # Silently skip framework detection if file is unreadable
+            with open(project_dir / "pyproject.toml", "rb") as f:
+                deps = _python_dependency_names(tomllib.load(f))
+            framework = _match_framework(_PY_FRAMEWORKS, deps)
+        except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+            # Silently skip framework detection if file is missing or invalid
             pass
-    elif (project_dir / "pom.xml").exists() or (project_dir / "build.gradle").exists():
+    elif not _JAVA_MARKERS.isdisjoint(names):
         primary_language = "java"
-        package_manager = "maven" if (project_dir / "pom.xml").exists() else "gradle"
+        package_manager = "maven" if "pom.xml" in names else "gradle"
     
     # Detect database
-    if (project_dir / "docker-compose.yml").exists() or (project_dir / "docker-compose.yaml").exists():
+    compose_name = next(
+        (name for name in ("docker-compose.yml", "docker-compose.yaml") if name in names),
+        None,
+    )
+    if compose_name:
         try:
             import yaml
-            compose_file = project_dir / "docker-compose.yml"
-            if not compose_file.exists():
-                compose_file = project_dir / "docker-compose.yaml"
-            if compose_file.exists():
-                with open(compose_file, "r", encoding="utf-8") as f:
-                    compose_data = yaml.safe_load(f)
-                    services = compose_data.get("services", {})
-                    for service_name, service_config in services.items():
-                        image = service_config.get("image", "")
-                        if "postgres" in image.lower():
-                            database = "postgresql"
-                        elif "mysql" in image.lower():
-                            database = "mysql"
-                        elif "mongodb" in image.lower():
-                            database = "mongodb"
-                        elif "redis" in image.lower():
-                            detected_services.append("redis")
+            with open(project_dir / compose_name, "r", encoding="utf-8") as f:
+                compose_data = yaml.safe_load(f)
+                services = compose_data.get("services", {})
+                for service_config in services.values():
+                    match = _COMPOSE_IMAGE_PATTERN.search(service_config.get("image", ""))
+                    if match is None:
+                        continue
+                    kind = match.group(0).lower()
+                    if kind == "redis":
+                        detected_services.append("redis")
+                    else:
+                        database = _COMPOSE_DATABASES[kind]
         except (ImportError, FileNotFoundError, yaml.YAMLError):
             # Silently skip docker-compose detection if yaml unavailable or file invalid
             pass
     
     # Detect services
-    if (project_dir / "Dockerfile").exists():
+    if "Dockerfile" in names and "Dockerfile" not in dirs:
         detected_services.append("docker")
-    if (project_dir / ".github/workflows").exists():
+    if _has_workflow_file(project_dir / ".github" / "workflows"):
         detected_services.append("github-actions")
-    if (project_dir / "k8s").exists() or (project_dir / "kubernetes").exists():
+    if not _K8S_DIRS.isdisjoint(dirs):
         detected_services.append("kubernetes")
     
     # Detect monorepo
@@ -322,28 +554,33 @@ def detect_project_technology(project_dir: Path) -> ProjectTechnology:
     )
 
 
+detect_project_technology.cache_clear = _detect_project_technology_cached.cache_clear
+
+
 def generate_mcp_context(project_dir: Path, servers: list[MCPServer], tech: ProjectTechnology) -> None:
     """Generate MCP context files in .specify/context/."""
     context_dir = project_dir / ".specify" / "context"
     context_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate markdown summary
-    md_file = context_dir / "mcp-servers.md"
-    with open(md_file, "w", encoding="utf-8") as f:
-        f.write("# MCP Servers Available\n\n")
-        f.write(f"**Generated:** {__import__('datetime').datetime.now().isoformat()}\n\n")
-        
-        if servers:
-            f.write("## Discovered Servers\n\n")
-            f.write("| Server | Source | Description | Capabilities |\n")
-            f.write("|--------|--------|-------------|--------------|\n")
-            for server in servers:
-                caps = ", ".join(server.capabilities[:3])
-                if len(server.capabilities) > 3:
-                    caps += f" (+{len(server.capabilities) - 3} more)"
-                f.write(f"| {server.name} | {server.source} | {server.description} | {caps} |\n")
-        else:
-            f.write("No MCP servers discovered.\n")
+    parts = [
+        "# MCP Servers Available\n\n",
+        f"**Generated:** {datetime.now().isoformat()}\n\n",
+    ]
+    
+    if servers:
+        parts.append("## Discovered Servers\n\n")
+        parts.append("| Server | Source | Description | Capabilities |\n")
+        parts.append("|--------|--------|-------------|--------------|\n")
+        for server in servers:
+            caps = ", ".join(server.capabilities[:3])
+            if len(server.capabilities) > 3:
+                caps += f" (+{len(server.capabilities) - 3} more)"
+            parts.append(f"| {server.name} | {server.source} | {server.description} | {caps} |\n")
+    else:
+        parts.append("No MCP servers discovered.\n")
+    
+    (context_dir / "mcp-servers.md").write_bytes("".join(parts).encode("utf-8"))
     
     # Generate JSON context
     json_file = context_dir / "project-context.json"
@@ -352,8 +589,37 @@ def generate_mcp_context(project_dir: Path, servers: list[MCPServer], tech: Proj
         "technology": asdict(tech),
     }
     
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(context_data, f, indent=2)
+    json_file.write_bytes(_json_dumps_indented(context_data))
+
+
+# Operation category -> (server names that enable it, operations it offers)
+_OPERATIONS_BY_SERVER = (
+    (
+        "database",
+        frozenset({"postgres", "postgresql", "sqlite"}),
+        ("query", "describe_table", "analyze_schema", "list_tables", "execute_sql"),
+    ),
+    (
+        "git",
+        frozenset({"git"}),
+        ("status", "diff", "log", "blame", "show", "commit"),
+    ),
+    (
+        "github",
+        frozenset({"github"}),
+        ("create_issue", "create_pr", "search_code", "list_issues", "comment_on_pr"),
+    ),
+    (
+        "filesystem",
+        frozenset({"filesystem"}),
+        ("read", "write", "search", "list", "delete"),
+    ),
+    (
+        "http",
+        frozenset({"fetch", "http"}),
+        ("get", "post", "put", "delete"),
+    ),
+)
 
 
 def get_available_mcp_operations(project_dir: Optional[Path] = None) -> dict[str, list[str]]:
@@ -378,56 +644,9 @@ def get_available_mcp_operations(project_dir: Optional[Path] = None) -> dict[str
     server_names = {s.name.lower() for s in servers}
 
     operations = {}
-
-    # Database operations
-    if "postgres" in server_names or "postgresql" in server_names or "sqlite" in server_names:
-        operations["database"] = [
-            "query",
-            "describe_table",
-            "analyze_schema",
-            "list_tables",
-            "execute_sql"
-        ]
-
-    # Git operations
-    if "git" in server_names:
-        operations["git"] = [
-            "status",
-            "diff",
-            "log",
-            "blame",
-            "show",
-            "commit"
-        ]
-
-    # GitHub operations
-    if "github" in server_names:
-        operations["github"] = [
-            "create_issue",
-            "create_pr",
-            "search_code",
-            "list_issues",
-            "comment_on_pr"
-        ]
-
-    # Filesystem operations
-    if "filesystem" in server_names:
-        operations["filesystem"] = [
-            "read",
-            "write",
-            "search",
-            "list",
-            "delete"
-        ]
-
-    # HTTP/Fetch operations
-    if "fetch" in server_names or "http" in server_names:
-        operations["http"] = [
-            "get",
-            "post",
-            "put",
-            "delete"
-        ]
+    for category, triggers, category_operations in _OPERATIONS_BY_SERVER:
+        if not triggers.isdisjoint(server_names):
+            operations[category] = list(category_operations)
 
     return operations
 
@@ -3,12 +3,61 @@ Monorepo detection and workspace support for project-specify.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+import fnmatch
+import functools
 import json
-import glob
+import os
+import posixpath
+import re
 
+from ._jsonio import loads as json_loads
 from .errors import MonorepoError
 
+# A `[workspace]` table header on its own line (Cargo.toml)
+_WORKSPACE_TABLE = re.compile(rb"^[ \t]*\[[ \t]*workspace[ \t]*\]", re.MULTILINE)
+
+
+def _load_json(path: Path):
+    """Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    The returned object is shared between callers and must not be mutated.
+
+    Args:
+        path: JSON file to load.
+
+    Returns:
+        The parsed JSON value.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read.
+        ValueError: If the file is not valid JSON (json.JSONDecodeError) or
+            not valid UTF-8.
+    """
+    st = os.stat(path)
+    return _load_json_cached(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int):
+    """Parse a JSON file keyed on its stat signature (memoized).
+
+    Decode errors propagate and are not cached, so every caller gets its own
+    exception instance even when several threads hit the same broken file.
+    """
+    with open(path_str, "rb") as f:
+        return json_loads(f.read())
+
+
+# Marker files checked in priority order; the first one present wins.
+_MONOREPO_INDICATORS = {
+    "pnpm-workspace.yaml": "pnpm",
+    "pnpm-workspace.yml": "pnpm",
+    "lerna.json": "lerna",
+    "nx.json": "nx",
+    "turbo.json": "turborepo",
+}
+
 
 def detect_monorepo_type(project_dir: Path) -> Optional[str]:
     """
@@ -16,24 +65,21 @@ def detect_monorepo_type(project_dir: Path) -> Optional[str]:
     
     Returns: "pnpm", "npm", "yarn", "lerna", "nx", "turborepo", "cargo", or None
     """
-    indicators = {
-        "pnpm-workspace.yaml": "pnpm",
-        "pnpm-workspace.yml": "pnpm",
-        "lerna.json": "lerna",
-        "nx.json": "nx",
-        "turbo.json": "turborepo",
-    }
-    
-    for filename, monorepo_type in indicators.items():
-        if (project_dir / filename).exists():
+    try:
+        with os.scandir(project_dir) as it:
+            names = {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    for filename, monorepo_type in _MONOREPO_INDICATORS.items():
+        if filename in names:
             return monorepo_type
     
     # Check package.json for workspaces
     package_json = project_dir / "package.json"
-    if package_json.exists():
+    if "package.json" in names:
         try:
-            with open(package_json, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(package_json)
             if "workspaces" in data:
                 return "npm"  # or yarn, they use same format
         except json.JSONDecodeError as e:
@@ -46,17 +92,17 @@ def detect_monorepo_type(project_dir: Path) -> Optional[str]:
             logging.debug(f"Error reading package.json: {e}")
     
     # Check Cargo.toml for Rust workspaces
-    cargo_toml = project_dir / "Cargo.toml"
-    if cargo_toml.exists():
-        try:
-            # Simple check for [workspace] section
-            content = cargo_toml.read_text(encoding="utf-8")
-            if "[workspace]" in content:
-                return "cargo"
-        except (FileNotFoundError, UnicodeDecodeError) as e:
-            # Cargo.toml unreadable - log but don't fail
-            import logging
-            logging.debug(f"Error reading Cargo.toml: {e}")
+    if "Cargo.toml" not in names:
+        return None
+    try:
+        if _WORKSPACE_TABLE.search((project_dir / "Cargo.toml").read_bytes()):
+            return "cargo"
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        # Cargo.toml unreadable - log but don't fail
+        import logging
+        logging.debug(f"Error reading Cargo.toml: {e}")
     
     return None
 
@@ -80,9 +126,79 @@ def get_workspace_packages(project_dir: Path, monorepo_type: str) -> list[Path]:
     return packages
 
 
+def _find_pnpm_workspace_file(project_dir: Path) -> Optional[Path]:
+    """Return the pnpm workspace file (.yaml preferred over .yml), if any."""
+    for name in ("pnpm-workspace.yaml", "pnpm-workspace.yml"):
+        workspace_file = project_dir / name
+        if workspace_file.exists():
+            return workspace_file
+    return None
+
+
+def _parse_pnpm_packages(content: str) -> Optional[list[str]]:
+    """Extract the top-level `packages:` list from pnpm-workspace.yaml text.
+
+    Handles the block-list shape pnpm documents: quoted or bare scalars,
+    comments and blank lines, plus other top-level keys, which are skipped.
+
+    Args:
+        content: Workspace file contents.
+
+    Returns:
+        The package patterns, or None if the file uses a construct this
+        parser does not understand (flow lists, anchors, nested mappings,
+        ...) and needs a real YAML parser.
+    """
+    patterns = []
+    found = False
+    in_packages = False
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        if line[0] not in " \t-":
+            # Top-level key: `packages:` opens the list, others are skipped
+            key, sep, rest = stripped.partition(":")
+            rest = rest.strip()
+            if not sep or not key.replace("-", "").replace("_", "").isalnum():
+                return None
+            in_packages = key == "packages"
+            if in_packages:
+                if rest and not rest.startswith("#"):
+                    return None  # Inline/flow value
+                found = True
+            continue
+
+        if not in_packages:
+            continue  # Body of a key we don't care about
+        if not stripped.startswith("-"):
+            return None
+
+        item = stripped[1:].strip()
+        if item[:1] in ("'", '"'):
+            end = item.find(item[0], 1)
+            if end == -1:
+                return None
+            tail = item[end + 1:].strip()
+            if tail and not tail.startswith("#"):
+                return None
+            item = item[1:end]
+        else:
+            item = item.split(" #", 1)[0].strip()
+            if not item or item[0] in "[{&*!|>" or ": " in item:
+                return None
+        patterns.append(item)
+
+    return patterns if found else None
+
+
 def _get_pnpm_workspaces(project_dir: Path) -> list[Path]:
     """Parse pnpm-workspace.yaml for package locations.
 
+    The lightweight line parser handles the usual file shape; PyYAML is only
+    imported for files it doesn't recognize.
+
     Args:
         project_dir: Root directory of the monorepo.
 
@@ -92,22 +208,30 @@ def _get_pnpm_workspaces(project_dir: Path) -> list[Path]:
     Raises:
         MonorepoError: If workspace configuration is malformed.
     """
+    workspace_file = _find_pnpm_workspace_file(project_dir)
+    if workspace_file is None:
+        return []
+
     try:
-        import yaml
-    except ImportError:
-        # Fallback to simple parsing if yaml not available
-        return _get_pnpm_workspaces_simple(project_dir)
+        content = workspace_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        import logging
+        logging.debug(f"Error reading pnpm workspace file: {e}")
+        return []
 
-    workspace_file = project_dir / "pnpm-workspace.yaml"
-    if not workspace_file.exists():
-        workspace_file = project_dir / "pnpm-workspace.yml"
+    patterns = _parse_pnpm_packages(content)
+    if patterns is not None:
+        return _expand_glob_patterns(project_dir, patterns)
 
-    if not workspace_file.exists():
+    try:
+        import yaml
+    except ImportError:
+        import logging
+        logging.debug(f"Unsupported pnpm workspace syntax in {workspace_file} and PyYAML unavailable")
         return []
 
     try:
-        with open(workspace_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.safe_load(content)
         patterns = data.get("packages", [])
         return _expand_glob_patterns(project_dir, patterns)
     except yaml.YAMLError as e:
@@ -130,35 +254,18 @@ def _get_pnpm_workspaces_simple(project_dir: Path) -> list[Path]:
     Returns:
         List of workspace package directories.
     """
-    workspace_file = project_dir / "pnpm-workspace.yaml"
-    if not workspace_file.exists():
-        workspace_file = project_dir / "pnpm-workspace.yml"
-
-    if not workspace_file.exists():
+    workspace_file = _find_pnpm_workspace_file(project_dir)
+    if workspace_file is None:
         return []
 
     try:
         content = workspace_file.read_text(encoding="utf-8")
-        # Simple regex-like extraction
-        patterns = []
-        in_packages = False
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("packages:"):
-                in_packages = True
-                continue
-            if in_packages and line.startswith("-"):
-                pattern = line[1:].strip().strip('"').strip("'")
-                if pattern:
-                    patterns.append(pattern)
-            elif in_packages and line and not line.startswith("#"):
-                break
-        return _expand_glob_patterns(project_dir, patterns)
     except (FileNotFoundError, UnicodeDecodeError) as e:
         # File unreadable - log but don't fail
         import logging
         logging.debug(f"Error reading pnpm workspace file: {e}")
         return []
+    return _expand_glob_patterns(project_dir, _parse_pnpm_packages(content) or [])
 
 
 def _get_npm_workspaces(project_dir: Path) -> list[Path]:
@@ -174,12 +281,8 @@ def _get_npm_workspaces(project_dir: Path) -> list[Path]:
         MonorepoError: If package.json is malformed.
     """
     package_json = project_dir / "package.json"
-    if not package_json.exists():
-        return []
-
     try:
-        with open(package_json, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(package_json)
         workspaces = data.get("workspaces", [])
 
         # Handle both array and object format
@@ -187,6 +290,8 @@ def _get_npm_workspaces(project_dir: Path) -> list[Path]:
             workspaces = workspaces.get("packages", [])
 
         return _expand_glob_patterns(project_dir, workspaces)
+    except FileNotFoundError:
+        return []
     except json.JSONDecodeError as e:
         raise MonorepoError(
             f"Invalid JSON in package.json at {package_json}: {e}"
@@ -211,14 +316,12 @@ def _get_lerna_packages(project_dir: Path) -> list[Path]:
         MonorepoError: If lerna.json is malformed.
     """
     lerna_json = project_dir / "lerna.json"
-    if not lerna_json.exists():
-        return []
-
     try:
-        with open(lerna_json, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(lerna_json)
         patterns = data.get("packages", ["packages/*"])
         return _expand_glob_patterns(project_dir, patterns)
+    except FileNotFoundError:
+        return []
     except json.JSONDecodeError as e:
         raise MonorepoError(
             f"Invalid JSON in lerna.json at {lerna_json}: {e}"
@@ -243,71 +346,135 @@ def _get_cargo_members(project_dir: Path) -> list[Path]:
         MonorepoError: If Cargo.toml is malformed.
     """
     cargo_toml = project_dir / "Cargo.toml"
-    if not cargo_toml.exists():
+    try:
+        raw = cargo_toml.read_bytes()
+    except FileNotFoundError:
         return []
 
+    import tomllib
     try:
-        content = cargo_toml.read_text(encoding="utf-8")
-        # Simple extraction of members from [workspace] section
-        members = []
-        in_workspace = False
-        in_members = False
-        import re
-
-        for line in content.split("\n"):
-            line_stripped = line.strip()
-            if line_stripped == "[workspace]":
-                in_workspace = True
-                continue
-            if in_workspace and line_stripped.startswith("members"):
-                in_members = True
-                # Extract from members = ["...", "..."]
-                if "=" in line:
-                    members_str = line.split("=", 1)[1].strip()
-                    # Extract quoted strings from this line
-                    matches = re.findall(r'["\']([^"\']+)["\']', members_str)
-                    members.extend(matches)
-                continue
-            # Continue parsing members array if we're inside it
-            if in_members:
-                if line_stripped.startswith("]"):
-                    in_members = False
-                    break
-                # Extract quoted strings from continuation lines
-                matches = re.findall(r'["\']([^"\']+)["\']', line_stripped)
-                members.extend(matches)
-                continue
-            # Stop if we hit another section
-            if in_workspace and line_stripped.startswith("[") and line_stripped != "[workspace]":
-                break
-
-        return _expand_glob_patterns(project_dir, members)
-    except (FileNotFoundError, UnicodeDecodeError) as e:
+        data = tomllib.loads(raw.decode("utf-8"))
+    except tomllib.TOMLDecodeError as e:
+        raise MonorepoError(
+            f"Invalid TOML in Cargo.toml at {cargo_toml}: {e}"
+        ) from e
+    except UnicodeDecodeError as e:
         # File unreadable - log but don't fail
         import logging
         logging.debug(f"Error reading Cargo.toml: {e}")
         return []
 
+    # The parse is authoritative: it also sees `workspace.members = [...]`
+    # dotted keys that the header regex used by detection can't
+    members = data.get("workspace", {}).get("members", [])
+    return _expand_glob_patterns(project_dir, [m for m in members if isinstance(m, str)])
+
+
+def _has_glob_magic(pattern: str) -> bool:
+    """Check whether a pattern contains glob wildcards."""
+    return any(c in pattern for c in "*?[")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(segment: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile a glob segment once into a case-sensitive regex matcher."""
+    return re.compile(fnmatch.translate(segment)).match
+
+
+def _matching_child_dirs(parent: str, segment: str) -> list[str]:
+    """List subdirectories of parent whose names match a glob segment.
+
+    Uses the file type cached on each DirEntry, so regular entries cost no
+    extra stat. Hidden entries only match segments that start with a dot, and
+    symlinks to directories are followed, both as with `glob`.
+    """
+    include_hidden = segment.startswith(".")
+    match = _compile_glob(segment)
+    try:
+        with os.scandir(parent) as it:
+            return [
+                entry.path
+                for entry in it
+                if (include_hidden or not entry.name.startswith("."))
+                and match(entry.name)
+                and entry.is_dir()
+            ]
+    except OSError:
+        return []
+
+
+def _expand_pattern(base_dir: str, pattern: str) -> list[str]:
+    """Expand one workspace glob pattern to matching directory paths.
+
+    Literal segments are joined without touching the filesystem and wildcard
+    segments cost one scandir per candidate directory. As with non-recursive
+    `glob`, `**` matches a single level, like `*`.
+    """
+    segments = [seg for seg in pattern.split("/") if seg and seg != "."]
+    if not _has_glob_magic(pattern):
+        path = os.path.join(base_dir, *segments)
+        return [path] if os.path.isdir(path) else []
+
+    candidates = [base_dir]
+    for segment in segments:
+        if _has_glob_magic(segment):
+            candidates = [
+                d for parent in candidates for d in _matching_child_dirs(parent, segment)
+            ]
+        else:
+            candidates = [os.path.join(parent, segment) for parent in candidates]
+        if not candidates:
+            return []
+
+    # A trailing literal segment was never checked against the filesystem
+    if not _has_glob_magic(segments[-1]):
+        candidates = [c for c in candidates if os.path.isdir(c)]
+    return candidates
+
+
+# Below this many patterns, thread start-up costs more than it saves
+_PARALLEL_PATTERN_THRESHOLD = 4
+
 
 def _expand_glob_patterns(base_dir: Path, patterns: list[str]) -> list[Path]:
-    """Expand glob patterns to actual directories."""
-    results = []
-    for pattern in patterns:
-        # Handle negation patterns
-        if pattern.startswith("!"):
-            continue
-        
-        # Convert to absolute path pattern
-        if pattern.startswith("/"):
-            pattern = pattern[1:]
-        
-        # Use glob to find matches
-        matches = glob.glob(str(base_dir / pattern))
-        for match in matches:
-            path = Path(match)
-            if path.is_dir():
-                results.append(path)
+    """Expand glob patterns to actual directories.
+
+    Patterns are walked segment by segment with `os.scandir` rather than
+    `glob`, so directory checks come from each DirEntry's cached file type.
+    Matches are de-duplicated as plain strings and only turned into `Path`
+    objects once, at the end. Four or more patterns are expanded on a small
+    thread pool.
+
+    Args:
+        base_dir: Directory the patterns are relative to.
+        patterns: Workspace glob patterns; `!` negations are skipped.
+
+    Returns:
+        Sorted, de-duplicated list of matching directories.
+    """
+    base = str(base_dir)
+    # Anchor at base_dir and collapse "./", "//" and "dir/.." up front so
+    # equivalent spellings produce identical strings for the set below.
+    # Negation patterns are skipped.
+    normalized = [
+        posixpath.normpath(pattern.lstrip("/"))
+        for pattern in dict.fromkeys(patterns)
+        if not pattern.startswith("!")
+    ]
+
+    if len(normalized) >= _PARALLEL_PATTERN_THRESHOLD:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Each pattern's scandir walk is independent and I/O bound
+        with ThreadPoolExecutor(max_workers=min(8, len(normalized))) as ex:
+            expansions = list(ex.map(lambda p: _expand_pattern(base, p), normalized))
+    else:
+        expansions = [_expand_pattern(base, p) for p in normalized]
+
+    results: set[str] = set()
+    for paths in expansions:
+        results.update(paths)
     
     # Remove duplicates and sort
-    return sorted(set(results))
+    return sorted(Path(p) for p in results)
 
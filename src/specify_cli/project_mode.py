@@ -12,6 +12,9 @@ from typing import Literal, Optional
 
 ProjectMode = Literal["project", "feature", "unknown"]
 
+# Subdirectories shared by .specify/research and .specify/research-seeds
+_RESEARCH_CATEGORIES = ("technical", "domain", "user", "constraints")
+
 
 def detect_project_mode(project_dir: Optional[Path] = None) -> ProjectMode:
     """
@@ -191,7 +194,7 @@ def create_research_structure(project_dir: Optional[Path] = None) -> None:
 
     research_dir = project_dir / ".specify" / "research"
 
-    for category in ["technical", "domain", "user", "constraints"]:
+    for category in _RESEARCH_CATEGORIES:
         category_dir = research_dir / category
         category_dir.mkdir(parents=True, exist_ok=True)
 
@@ -218,7 +221,7 @@ def create_research_seeds_structure(project_dir: Optional[Path] = None) -> None:
 
     seeds_dir = project_dir / ".specify" / "research-seeds"
 
-    for category in ["technical", "domain", "user", "constraints"]:
+    for category in _RESEARCH_CATEGORIES:
         category_dir = seeds_dir / category
         category_dir.mkdir(parents=True, exist_ok=True)
 
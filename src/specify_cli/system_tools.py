@@ -1,9 +1,10 @@
 """System utilities for running commands and checking tools."""
 
+import os
 import subprocess
 import shutil
-from typing import Optional
-from pathlib import Path
+import sys
+from typing import Iterable, Optional
 
 from .config import CLAUDE_LOCAL_PATH
 
@@ -53,12 +54,58 @@ def run_command(
         return None
 
 
-def check_tool(tool: str, tracker=None) -> bool:
+def find_executables(names: Iterable[str]) -> dict[str, str]:
+    """Locate several executables with a single pass over PATH.
+
+    Each PATH directory is listed once with os.scandir, instead of stat-ing
+    every candidate path per tool as repeated shutil.which calls do. Only
+    entries whose name matches a wanted tool are checked further. On Windows,
+    names match case-insensitively with any PATHEXT extension.
+
+    Args:
+        names: Tool names to look for.
+
+    Returns:
+        Mapping of each found tool name to its first match on PATH.
+    """
+    wanted = set(names)
+    if sys.platform == "win32":
+        pathext = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").lower().split(os.pathsep)
+        lookup = {f"{name}{ext}".lower(): name for name in wanted for ext in pathext if ext}
+    else:
+        lookup = {name: name for name in wanted}
+
+    found: dict[str, str] = {}
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            name = lookup.get(entry.name.lower() if sys.platform == "win32" else entry.name)
+            if name is None or name in found:
+                continue
+            try:
+                if entry.is_file() and os.access(entry.path, os.X_OK):
+                    found[name] = entry.path
+            except OSError:
+                continue
+        if len(found) == len(wanted):
+            break
+    return found
+
+
+def check_tool(tool: str, tracker=None, path_index: Optional[dict[str, str]] = None) -> bool:
     """Check if a tool is installed. Optionally update tracker.
 
     Args:
         tool: Name of the tool to check.
         tracker: Optional StepTracker to update with results.
+        path_index: Result of find_executables() to consult instead of
+            searching PATH again for this tool.
 
     Returns:
         True if tool is found, False otherwise.
@@ -74,7 +121,10 @@ def check_tool(tool: str, tracker=None) -> bool:
                 tracker.complete(tool, "available")
             return True
 
-    found = shutil.which(tool) is not None
+    if path_index is not None:
+        found = tool in path_index
+    else:
+        found = shutil.which(tool) is not None
 
     if tracker:
         if found:
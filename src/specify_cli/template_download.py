@@ -8,16 +8,74 @@ from pathlib import Path
 from typing import Tuple
 
 import httpx
+import platformdirs
 import typer
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .ui import console, StepTracker
-from .github_api import github_auth_headers, format_rate_limit_error, ssl_context
+from .github_api import github_auth_headers, format_rate_limit_error, get_client
 from .file_operations import handle_vscode_settings
+from ._jsonio import dumps as json_dumps, loads as json_loads
 from .errors import TemplateError, NetworkError
 
 
+def _template_cache_dir() -> Path:
+    """Return the directory used to cache release metadata and template zips."""
+    return Path(platformdirs.user_cache_dir("project-specify")) / "templates"
+
+
+def _write_cached_json(path: Path, data: dict) -> None:
+    """Atomically write a JSON cache file; caching failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(json_dumps(data))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _read_cached_release(cache_dir: Path) -> dict | None:
+    """Return the cached `{"etag", "release"}` entry, or None if unusable."""
+    try:
+        cached = json_loads((cache_dir / "release.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+    if isinstance(cached, dict) and cached.get("etag") and isinstance(cached.get("release"), dict):
+        return cached
+    return None
+
+
+def _copy_cached_asset(cache_dir: Path, filename: str, asset_key: dict, zip_path: Path) -> bool:
+    """Copy a cached template zip to zip_path if it matches the release asset.
+
+    Returns:
+        True if the cached copy was used, False if the asset must be downloaded.
+    """
+    cached_zip = cache_dir / filename
+    try:
+        cached_key = json_loads((cache_dir / f"{filename}.json").read_bytes())
+        if cached_key != asset_key or cached_zip.stat().st_size != asset_key["size"]:
+            return False
+        shutil.copyfile(cached_zip, zip_path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _store_cached_asset(cache_dir: Path, filename: str, asset_key: dict, zip_path: Path) -> None:
+    """Save a downloaded template zip into the cache; failures are ignored."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_dir / f"{filename}.{os.getpid()}.tmp"
+        shutil.copyfile(zip_path, tmp)
+        os.replace(tmp, cache_dir / filename)
+    except OSError:
+        return
+    _write_cached_json(cache_dir / f"{filename}.json", asset_key)
+
+
 def download_template_from_github(
     ai_assistant: str,
     download_dir: Path,
@@ -41,6 +99,10 @@ def download_template_from_github(
         debug: Whether to include debug information in errors.
         github_token: Optional GitHub token for authentication.
 
+    The release metadata is requested with the ETag from the previous run, and
+    the template zip is served from the local cache when the release asset is
+    unchanged.
+
     Returns:
         Tuple of (zip_path, metadata_dict).
 
@@ -50,32 +112,45 @@ def download_template_from_github(
     repo_owner = "github"
     repo_name = "spec-kit"
     if client is None:
-        client = httpx.Client(verify=ssl_context)
+        client = get_client()
 
     if verbose:
         console.print("[cyan]Fetching latest release information...[/cyan]")
     api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
 
+    cache_dir = _template_cache_dir()
+    cached_release = _read_cached_release(cache_dir)
+    headers = github_auth_headers(github_token)
+    if cached_release:
+        # 304 responses don't count against the GitHub rate limit
+        headers = {**headers, "If-None-Match": cached_release["etag"]}
+
     try:
         response = client.get(
             api_url,
             timeout=30,
             follow_redirects=True,
-            headers=github_auth_headers(github_token),
+            headers=headers,
         )
         status = response.status_code
-        if status != 200:
+        if status == 304 and cached_release:
+            release_data = cached_release["release"]
+        elif status != 200:
             # Format detailed error message with rate-limit info
             error_msg = format_rate_limit_error(status, response.headers, api_url)
             if debug:
                 error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
             raise NetworkError(error_msg)
-        try:
-            release_data = response.json()
-        except ValueError as je:
-            raise TemplateError(
-                f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}"
-            ) from je
+        else:
+            try:
+                release_data = json_loads(response.content)
+            except ValueError as je:
+                raise TemplateError(
+                    f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}"
+                ) from je
+            etag = response.headers.get("ETag")
+            if etag:
+                _write_cached_json(cache_dir / "release.json", {"etag": etag, "release": release_data})
     except NetworkError:
         # Re-raise network errors
         raise
@@ -121,6 +196,17 @@ def download_template_from_github(
         console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
 
     zip_path = download_dir / filename
+    asset_key = {"id": asset.get("id"), "size": file_size, "updated_at": asset.get("updated_at")}
+    if _copy_cached_asset(cache_dir, filename, asset_key, zip_path):
+        if verbose:
+            console.print(f"Using cached template: {filename}")
+        return zip_path, {
+            "filename": filename,
+            "size": file_size,
+            "release": release_data["tag_name"],
+            "asset_url": download_url
+        }
+
     if verbose:
         console.print(f"[cyan]Downloading template...[/cyan]")
 
@@ -141,7 +227,7 @@ def download_template_from_github(
             total_size = int(response.headers.get('content-length', 0))
             with open(zip_path, 'wb') as f:
                 if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
+                    for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
                 else:
                     if show_progress:
@@ -153,12 +239,12 @@ def download_template_from_github(
                         ) as progress:
                             task = progress.add_task("Downloading...", total=total_size)
                             downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
+                            for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                                 f.write(chunk)
                                 downloaded += len(chunk)
                                 progress.update(task, completed=downloaded)
                     else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
+                        for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                             f.write(chunk)
     except NetworkError:
         # Re-raise network errors
@@ -179,6 +265,7 @@ def download_template_from_github(
         raise TemplateError(f"Download failed: {detail}") from e
     if verbose:
         console.print(f"Downloaded: {filename}")
+    _store_cached_asset(cache_dir, filename, asset_key, zip_path)
     metadata = {
         "filename": filename,
         "size": file_size,
@@ -188,6 +275,44 @@ def download_template_from_github(
     return zip_path, metadata
 
 
+_DOWNLOAD_CHUNK_SIZE = 1 << 16  # Large enough to cut write() calls, small enough for progress
+_COPY_BUFSIZE = 1 << 20  # 1 MiB per read when streaming zip members
+
+
+def _extract_zip(zip_ref: zipfile.ZipFile, dest: Path) -> None:
+    """Extract all members of an archive into dest.
+
+    Equivalent to ``ZipFile.extractall`` (including its sanitizing of absolute
+    paths and ``..`` components) but creates each directory once up front and
+    streams member data in 1 MiB chunks.
+
+    Args:
+        zip_ref: Open archive to extract.
+        dest: Destination directory.
+    """
+    dirs: set[str] = set()
+    files: list[tuple[zipfile.ZipInfo, str]] = []
+    for info in zip_ref.infolist():
+        parts = [
+            p for p in os.path.splitdrive(info.filename)[1].replace("\\", "/").split("/")
+            if p not in ("", ".", "..")
+        ]
+        if not parts:
+            continue
+        target = os.path.join(dest, *parts)
+        if info.is_dir():
+            dirs.add(target)
+        else:
+            dirs.add(os.path.dirname(target))
+            files.append((info, target))
+
+    for directory in sorted(dirs):
+        os.makedirs(directory, exist_ok=True)
+    for info, target in files:
+        with zip_ref.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+
 def download_and_extract_template(
     project_path: Path,
     ai_assistant: str,
@@ -272,7 +397,7 @@ def download_and_extract_template(
             if is_current_dir:
                 with tempfile.TemporaryDirectory() as temp_dir:
                     temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
+                    _extract_zip(zip_ref, temp_path)
 
                     extracted_items = list(temp_path.iterdir())
                     if tracker:
@@ -296,21 +421,27 @@ def download_and_extract_template(
                             if dest_path.exists():
                                 if verbose and not tracker:
                                     console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
-                                for sub_item in item.rglob('*'):
-                                    if sub_item.is_file():
-                                        rel_path = sub_item.relative_to(item)
-                                        dest_file = dest_path / rel_path
-                                        dest_file.parent.mkdir(parents=True, exist_ok=True)
+                                # Plain string paths: one Path per file adds up on large templates
+                                for dirpath, _dirnames, filenames in os.walk(item):
+                                    if not filenames:
+                                        continue
+                                    rel_dir = os.path.relpath(dirpath, item)
+                                    dest_dir = os.path.normpath(os.path.join(dest_path, rel_dir))
+                                    os.makedirs(dest_dir, exist_ok=True)
+                                    for name in filenames:
+                                        src_file = os.path.join(dirpath, name)
+                                        dest_file = os.path.join(dest_dir, name)
                                         # Special handling for .vscode/settings.json - merge instead of overwrite
                                         if (
-                                            dest_file.name == "settings.json"
-                                            and dest_file.parent.name == ".vscode"
+                                            name == "settings.json"
+                                            and os.path.basename(dest_dir) == ".vscode"
                                         ):
+                                            rel_path = os.path.normpath(os.path.join(rel_dir, name))
                                             handle_vscode_settings(
-                                                sub_item, dest_file, str(rel_path), verbose, tracker
+                                                Path(src_file), Path(dest_file), rel_path, verbose, tracker
                                             )
                                         else:
-                                            shutil.copy2(sub_item, dest_file)
+                                            shutil.copy2(src_file, dest_file)
                             else:
                                 shutil.copytree(item, dest_path)
                         else:
@@ -320,7 +451,7 @@ def download_and_extract_template(
                     if verbose and not tracker:
                         console.print(f"[cyan]Template files merged into current directory[/cyan]")
             else:
-                zip_ref.extractall(project_path)
+                _extract_zip(zip_ref, project_path)
 
                 extracted_items = list(project_path.iterdir())
                 if tracker:
@@ -389,33 +520,46 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
         return
     failures: list[str] = []
     updated = 0
-    for script in scripts_root.rglob("*.sh"):
+    # Walk with scandir: entry types and lstat results are cached on each
+    # DirEntry, and already-executable scripts are skipped before any open()
+    stack = [os.fspath(scripts_root)]
+    while stack:
         try:
-            if script.is_symlink() or not script.is_file():
-                continue
-            try:
-                with script.open("rb") as f:
-                    if f.read(2) != b"#!":
-                        continue
-            except Exception:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
                 continue
-            st = script.stat()
-            mode = st.st_mode
-            if mode & 0o111:
+            if not entry.name.endswith(".sh"):
                 continue
-            new_mode = mode
-            if mode & 0o400:
-                new_mode |= 0o100
-            if mode & 0o040:
-                new_mode |= 0o010
-            if mode & 0o004:
-                new_mode |= 0o001
-            if not (new_mode & 0o100):
-                new_mode |= 0o100
-            os.chmod(script, new_mode)
-            updated += 1
-        except Exception as e:
-            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                mode = entry.stat(follow_symlinks=False).st_mode
+                if mode & 0o111:
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        if f.read(2) != b"#!":
+                            continue
+                except Exception:
+                    continue
+                new_mode = mode
+                if mode & 0o400:
+                    new_mode |= 0o100
+                if mode & 0o040:
+                    new_mode |= 0o010
+                if mode & 0o004:
+                    new_mode |= 0o001
+                if not (new_mode & 0o100):
+                    new_mode |= 0o100
+                os.chmod(entry.path, new_mode)
+                updated += 1
+            except Exception as e:
+                failures.append(f"{os.path.relpath(entry.path, scripts_root)}: {e}")
     if tracker:
         detail = f"{updated} updated" + (f", {len(failures)} failed" if failures else "")
         tracker.add("chmod", "Set script permissions recursively")
@@ -1,8 +1,6 @@
 """UI components and display utilities for project-specify."""
 
-import sys
 import typer
-import readchar
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -162,6 +160,8 @@ def get_key():
     Raises:
         KeyboardInterrupt: If Ctrl+C is pressed.
     """
+    import readchar  # Only interactive selection needs it
+
     key = readchar.readkey()
 
     if key == readchar.key.UP or key == readchar.key.CTRL_P:
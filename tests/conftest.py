@@ -4,9 +4,12 @@ import json
 import tempfile
 from pathlib import Path
 from typing import Generator
+import orjson
 import pytest
 import responses as responses_lib
 
+from specify_cli.git_operations import is_git_repo
+from specify_cli.mcp_discovery import detect_project_technology, discover_mcp_servers
 from specify_cli.symlink_manager import ensure_central_installation, get_central_dir
 
 
@@ -24,6 +27,21 @@ def temp_project() -> Generator[Path, None, None]:
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
+    is_git_repo.cache_clear()
+    detect_project_technology.cache_clear()
+    discover_mcp_servers.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def temp_project_readonly(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create an empty project directory shared by a module's read-only tests.
+
+    Tests using this fixture must not create or modify files in it.
+
+    Returns:
+        Path: Empty temporary project directory.
+    """
+    return tmp_path_factory.mktemp("readonly_project")
 
 
 @pytest.fixture
@@ -209,7 +227,7 @@ def mock_mcp_config(temp_project: Path) -> Path:
     mcp_dir.mkdir()
 
     config_file = mcp_dir / "servers.json"
-    config_file.write_text(json.dumps({
+    config_file.write_bytes(orjson.dumps({
         "mcpServers": {
             "filesystem": {
                 "command": "npx",
@@ -227,7 +245,7 @@ def mock_mcp_config(temp_project: Path) -> Path:
                 }
             }
         }
-    }, indent=2))
+    }, option=orjson.OPT_INDENT_2))
 
     return config_file
 
@@ -246,7 +264,7 @@ def mock_claude_desktop_config(tmp_path: Path) -> Path:
     config_dir.mkdir(parents=True)
 
     config_file = config_dir / "claude_desktop_config.json"
-    config_file.write_text(json.dumps({
+    config_file.write_bytes(orjson.dumps({
         "mcpServers": {
             "github": {
                 "command": "npx",
@@ -260,7 +278,7 @@ def mock_claude_desktop_config(tmp_path: Path) -> Path:
                 "args": ["-y", "@modelcontextprotocol/server-sqlite", "/path/to/db.sqlite"]
             }
         }
-    }, indent=2))
+    }, option=orjson.OPT_INDENT_2))
 
     return config_file
 
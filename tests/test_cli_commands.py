@@ -1,12 +1,17 @@
 """Tests for CLI commands."""
 
 import json
+import os
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
 from typer.testing import CliRunner
 
 from specify_cli import app
+from specify_cli.errors import MonorepoError
 from specify_cli.symlink_manager import parse_ai_argument
 
 
@@ -62,8 +67,9 @@ def test_parse_ai_argument_mixed_valid_invalid():
 
 def test_cli_app_exists():
     """Test that CLI app is properly initialized."""
-    assert app is not None
-    assert hasattr(app, "command")
+    from specify_cli.cli import app as bare_app
+
+    assert bare_app is not None
 
 
 def test_cli_help_command():
@@ -99,10 +105,10 @@ def test_check_command_basic():
     assert isinstance(result.exit_code, int)
 
 
-@patch("shutil.which")
-def test_check_command_tool_found(mock_which):
+@patch("specify_cli.commands.check_cmd.find_executables")
+def test_check_command_tool_found(mock_find):
     """Test check command detects installed tools."""
-    mock_which.return_value = "/usr/bin/git"
+    mock_find.return_value = {"git": "/usr/bin/git"}
 
     result = runner.invoke(app, ["check"])
 
@@ -111,10 +117,10 @@ def test_check_command_tool_found(mock_which):
     assert isinstance(result.exit_code, int)
 
 
-@patch("shutil.which")
-def test_check_command_tool_missing(mock_which):
+@patch("specify_cli.commands.check_cmd.find_executables")
+def test_check_command_tool_missing(mock_find):
     """Test check command handles missing tools."""
-    mock_which.return_value = None
+    mock_find.return_value = {}
 
     result = runner.invoke(app, ["check"])
 
@@ -122,6 +128,28 @@ def test_check_command_tool_missing(mock_which):
     assert isinstance(result.exit_code, int)
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bits")
+def test_find_executables_single_path_scan(tmp_path, monkeypatch):
+    """Test tools are found in PATH order and non-executables are skipped."""
+    from specify_cli.system_tools import find_executables
+
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    for directory in (first, second):
+        tool = directory / "tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+    (first / "notes").write_text("not executable")
+    (second / "notes").write_text("#!/bin/sh\n")
+    (second / "notes").chmod(0o755)
+
+    monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(second)]))
+    found = find_executables(["tool", "notes", "missing"])
+
+    assert found == {"tool": str(first / "tool"), "notes": str(second / "notes")}
+
+
 # =============================================================================
 # Discover Command Tests
 # =============================================================================
@@ -273,6 +301,43 @@ def test_init_command_existing_git_repo(mock_is_git_repo, temp_project):
     assert isinstance(result.exit_code, int)
 
 
+def test_install_bundled_files_keeps_existing(temp_project):
+    """Test bundled templates/scripts are copied once without overwriting."""
+    from specify_cli.commands.init_cmd import InitializationState, _install_bundled_files
+
+    specify_dir = temp_project / ".specify"
+    specify_dir.mkdir()
+    state = InitializationState(project_path=temp_project, was_empty_directory=False)
+
+    copied = _install_bundled_files(specify_dir, state)
+
+    templates = list((specify_dir / "templates").glob("*.md"))
+    assert copied > 0
+    assert templates
+
+    templates[0].write_text("customized")
+    assert _install_bundled_files(specify_dir, state) == 0
+    assert templates[0].read_text() == "customized"
+
+
+def test_install_bundled_files_rolled_back_in_existing_specify_dir(temp_project):
+    """Test rollback removes bundled files copied into a pre-existing .specify."""
+    from specify_cli.commands.init_cmd import InitializationState, _install_bundled_files
+    from specify_cli.ui import console
+
+    specify_dir = temp_project / ".specify"
+    (specify_dir / "memory").mkdir(parents=True)
+    (specify_dir / "memory" / "notes.md").write_text("keep me")
+    state = InitializationState(project_path=temp_project, was_empty_directory=False)
+
+    assert _install_bundled_files(specify_dir, state) > 0
+
+    state.rollback(console, verbose=False)
+
+    assert [p.name for p in specify_dir.iterdir()] == ["memory"]
+    assert (specify_dir / "memory" / "notes.md").read_text() == "keep me"
+
+
 def test_discover_command_no_directory():
     """Test discover command without directory argument."""
     result = runner.invoke(app, ["discover"])
@@ -286,6 +351,59 @@ def test_discover_command_no_directory():
 # =============================================================================
 
 
+@patch("specify_cli.symlink_manager.ensure_central_installation")
+@patch("specify_cli.symlink_manager.create_agent_symlinks")
+def test_init_new_project_inside_existing_repo(
+    mock_create_symlinks, mock_ensure_central, temp_project, monkeypatch
+):
+    """Test init <name> inside an existing repo reuses it instead of nesting one."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    subprocess.run(["git", "init", "-q"], cwd=temp_project, check=True)
+    mock_ensure_central.return_value = Path.home() / ".project-specify"
+    mock_create_symlinks.return_value = {"claude": True}
+    monkeypatch.chdir(temp_project)
+
+    result = runner.invoke(app, [
+        "init",
+        "newproj",
+        "--ai", "claude",
+        "--ignore-agent-tools",
+        "--no-mcp-discovery",
+    ])
+
+    assert result.exit_code == 0, result.stdout
+    assert (temp_project / "newproj").is_dir()
+    assert not (temp_project / "newproj" / ".git").exists()
+    assert "existing repo" in result.stdout
+
+
+@patch("specify_cli.symlink_manager.ensure_central_installation")
+@patch("specify_cli.symlink_manager.create_agent_symlinks")
+def test_init_workspace_with_malformed_cargo_manifest(
+    mock_create_symlinks, mock_ensure_central, temp_project, monkeypatch
+):
+    """Test --workspace warns instead of crashing on an unparsable workspace manifest."""
+    (temp_project / "Cargo.toml").write_text('[workspace]\nmembers = ["crates/*"\n')
+    mock_ensure_central.return_value = Path.home() / ".project-specify"
+    mock_create_symlinks.return_value = {"claude": True}
+    monkeypatch.chdir(temp_project)
+
+    result = runner.invoke(app, [
+        "init",
+        "newproj",
+        "--ai", "claude",
+        "--workspace", "core",
+        "--no-git",
+        "--ignore-agent-tools",
+        "--no-mcp-discovery",
+    ])
+
+    assert not isinstance(result.exception, MonorepoError)
+    assert result.exit_code == 0, result.stdout
+    assert "could not read workspace packages" in result.stdout
+
+
 @patch("specify_cli.template_download.download_and_extract_template")
 @patch("specify_cli.symlink_manager.ensure_central_installation")
 @patch("specify_cli.symlink_manager.create_agent_symlinks")
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import patch
 import pytest
 
+from specify_cli import mcp_discovery
 from specify_cli.mcp_discovery import (
     MCPServer,
     ProjectTechnology,
@@ -54,6 +55,17 @@ def test_mcp_server_defaults():
     assert server.capabilities == []
 
 
+def test_mcp_server_is_frozen():
+    """Test MCPServer instances are immutable and slotted."""
+    from dataclasses import FrozenInstanceError
+
+    server = MCPServer(name="minimal", command="test")
+
+    with pytest.raises(FrozenInstanceError):
+        server.name = "other"
+    assert not hasattr(server, "__dict__")
+
+
 # =============================================================================
 # Config Path Detection Tests
 # =============================================================================
@@ -188,11 +200,31 @@ def test_parse_mcp_config_invalid_json(temp_project):
     assert "Invalid JSON" in str(exc_info.value)
 
 
-def test_parse_mcp_config_missing_file(temp_project):
+def test_parse_mcp_config_invalid_json_stdlib_fallback(temp_project, monkeypatch):
+    """Test invalid JSON raises MCPDiscoveryError without orjson installed."""
+    from specify_cli.errors import MCPDiscoveryError
+
+    monkeypatch.setattr("specify_cli._jsonio.orjson", None)
+    config_file = temp_project / "invalid.json"
+    config_file.write_text("{ invalid json }")
+
+    with pytest.raises(MCPDiscoveryError, match="Invalid JSON"):
+        _parse_mcp_config(config_file, "test")
+
+
+def test_parse_mcp_config_empty_file(temp_project):
+    """Test an empty config file yields no servers instead of an error."""
+    config_file = temp_project / "empty.json"
+    config_file.write_text("\n")
+
+    assert _parse_mcp_config(config_file, "project") == []
+
+
+def test_parse_mcp_config_missing_file(temp_project_readonly):
     """Test parsing missing file raises MCPDiscoveryError."""
     from specify_cli.errors import MCPDiscoveryError
 
-    config_file = temp_project / "nonexistent.json"
+    config_file = temp_project_readonly / "nonexistent.json"
 
     with pytest.raises(MCPDiscoveryError) as exc_info:
         _parse_mcp_config(config_file, "test")
@@ -311,14 +343,60 @@ def test_discover_mcp_servers_multiple_sources(temp_project):
     assert "project-server" in server_names or "alt-server" in server_names
 
 
-def test_discover_mcp_servers_no_config(temp_project):
+def test_discover_mcp_servers_cache_invalidated_by_edit(temp_project):
+    """Test cached discovery results are reused until a config changes."""
+    config_file = temp_project / ".mcp.json"
+    config_file.write_text(json.dumps({"mcpServers": {"first": {"command": "node"}}}))
+
+    with patch(
+        "specify_cli.mcp_discovery._parse_mcp_config_safe",
+        wraps=mcp_discovery._parse_mcp_config_safe,
+    ) as parse:
+        first = discover_mcp_servers(temp_project)
+        calls = parse.call_count
+        assert discover_mcp_servers(temp_project) == first
+        assert parse.call_count == calls  # Served from the cache
+
+        config_file.write_text(json.dumps({"mcpServers": {"second": {"command": "node"}}}))
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+        names = {s.name for s in discover_mcp_servers(temp_project) if s.source == "project"}
+
+    assert names == {"second"}
+
+
+def test_discover_mcp_servers_results_are_independent(temp_project):
+    """Test mutating one discovery result doesn't leak into the cached copy."""
+    (temp_project / ".mcp.json").write_text(json.dumps({
+        "mcpServers": {"git": {"command": "uvx", "args": ["mcp-server-git"], "env": {"A": "1"}}}
+    }))
+
+    first = [s for s in discover_mcp_servers(temp_project) if s.name == "git"][0]
+    first.args.append("MUTATED")
+    first.env["B"] = "2"
+    first.capabilities.clear()
+
+    second = [s for s in discover_mcp_servers(temp_project) if s.name == "git"][0]
+    assert second.args == ["mcp-server-git"]
+    assert second.env == {"A": "1"}
+    assert second.capabilities == KNOWN_MCP_SERVERS["git"]["capabilities"]
+
+
+def test_discover_mcp_servers_no_config(temp_project_readonly):
     """Test discovering servers when no config exists."""
-    servers = discover_mcp_servers(temp_project)
+    servers = discover_mcp_servers(temp_project_readonly)
 
     # Should return empty list (or only system-wide configs if they exist)
     assert isinstance(servers, list)
 
 
+def test_discover_mcp_servers_missing_project_config_is_silent(temp_project_readonly, caplog):
+    """Test absent project configs are skipped without warnings."""
+    with caplog.at_level("WARNING"):
+        discover_mcp_servers(temp_project_readonly)
+
+    assert "project MCP config" not in caplog.text
+
+
 # =============================================================================
 # Technology Detection Tests
 # =============================================================================
@@ -338,6 +416,18 @@ dependencies = ["fastapi"]
     assert tech.package_manager == "pip"
 
 
+def test_detect_technology_cache_invalidated_by_edit(temp_project):
+    """Test cached detection is refreshed when an inspected file changes."""
+    pyproject = temp_project / "pyproject.toml"
+    pyproject.write_text('[project]\ndependencies = ["flask"]\n')
+    assert detect_project_technology(temp_project).framework == "flask"
+
+    pyproject.write_text('[project]\ndependencies = ["fastapi"]\n')
+    os.utime(pyproject, ns=(1, 1))
+
+    assert detect_project_technology(temp_project).framework == "fastapi"
+
+
 def test_detect_technology_nodejs_project(temp_project):
     """Test detecting Node.js project."""
     (temp_project / "package.json").write_text(json.dumps({
@@ -381,6 +471,29 @@ def test_detect_technology_nextjs_project(temp_project):
     assert tech.framework == "nextjs"
 
 
+def test_detect_technology_framework_in_dev_dependencies(temp_project):
+    """Test a framework listed only in devDependencies is detected."""
+    (temp_project / "package.json").write_text(json.dumps({
+        "dependencies": {"lodash": "^4.0.0"},
+        "devDependencies": {"svelte": "^4.0.0"},
+    }))
+
+    tech = detect_project_technology(temp_project)
+
+    assert tech.framework == "svelte"
+
+
+def test_detect_technology_nestjs_project(temp_project):
+    """Test NestJS takes priority over the Express it builds on."""
+    (temp_project / "package.json").write_text(json.dumps({
+        "dependencies": {"@nestjs/core": "^10.0.0", "express": "^4.18.0"}
+    }))
+
+    tech = detect_project_technology(temp_project)
+
+    assert tech.framework == "nestjs"
+
+
 def test_detect_technology_rust_project(temp_project):
     """Test detecting Rust project."""
     (temp_project / "Cargo.toml").write_text("""[package]
@@ -416,6 +529,18 @@ def test_detect_technology_python_with_poetry(temp_project):
     assert tech.package_manager == "poetry"
 
 
+def test_detect_technology_poetry_framework(temp_project):
+    """Test framework detection reads Poetry dependency tables, not raw text."""
+    (temp_project / "pyproject.toml").write_text(
+        '[tool.poetry]\ndescription = "Not a django app"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.11"\nFlask = "^3.0"\n'
+    )
+
+    tech = detect_project_technology(temp_project)
+
+    assert tech.framework == "flask"
+
+
 def test_detect_technology_python_with_pipenv(temp_project):
     """Test detecting Python project with Pipenv."""
     (temp_project / "Pipfile").write_text("[packages]\nrequests = \"*\"\n")
@@ -456,6 +581,15 @@ def test_detect_technology_with_docker(temp_project):
     assert "docker" in tech.detected_services
 
 
+def test_detect_technology_kubernetes_needs_directory(temp_project):
+    """Test only a k8s directory, not a file of that name, counts as Kubernetes."""
+    (temp_project / "k8s").write_text("not a manifest directory\n")
+    assert "kubernetes" not in detect_project_technology(temp_project).detected_services
+
+    (temp_project / "kubernetes").mkdir()
+    assert "kubernetes" in detect_project_technology(temp_project).detected_services
+
+
 def test_detect_technology_with_github_actions(temp_project):
     """Test detecting GitHub Actions."""
     (temp_project / ".github" / "workflows").mkdir(parents=True)
@@ -467,6 +601,34 @@ def test_detect_technology_with_github_actions(temp_project):
     assert "github-actions" in tech.detected_services
 
 
+def test_detect_technology_empty_workflows_dir(temp_project):
+    """Test an empty workflows directory does not count as GitHub Actions."""
+    (temp_project / ".github" / "workflows").mkdir(parents=True)
+
+    tech = detect_project_technology(temp_project)
+
+    assert "github-actions" not in tech.detected_services
+
+
+def test_detect_technology_compose_services(temp_project):
+    """Test database and redis detection from docker-compose image names."""
+    pytest.importorskip("yaml")
+    (temp_project / "docker-compose.yml").write_text(
+        "services:\n"
+        "  db:\n"
+        "    image: Postgres:16\n"
+        "  cache:\n"
+        "    image: redis:7-alpine\n"
+        "  app:\n"
+        "    build: .\n"
+    )
+
+    tech = detect_project_technology(temp_project)
+
+    assert tech.database == "postgresql"
+    assert "redis" in tech.detected_services
+
+
 def test_detect_technology_with_monorepo(mock_monorepo_pnpm):
     """Test detecting monorepo type."""
     tech = detect_project_technology(mock_monorepo_pnpm)
@@ -474,10 +636,10 @@ def test_detect_technology_with_monorepo(mock_monorepo_pnpm):
     assert tech.monorepo_type == "pnpm"
 
 
-def test_detect_technology_unknown_project(temp_project):
+def test_detect_technology_unknown_project(temp_project_readonly):
     """Test detecting unknown project type."""
     # Empty directory
-    tech = detect_project_technology(temp_project)
+    tech = detect_project_technology(temp_project_readonly)
 
     assert tech.primary_language == "unknown"
     assert tech.framework is None
@@ -641,3 +803,22 @@ def test_discover_mcp_servers_default_cwd(temp_project, monkeypatch):
     servers = discover_mcp_servers()  # No project_dir argument
 
     assert any(s.name == "local" for s in servers)
+
+
+def test_get_available_mcp_operations(temp_project):
+    """Test operation categories follow the discovered server names."""
+    from specify_cli.mcp_discovery import get_available_mcp_operations
+
+    (temp_project / ".mcp.json").write_text(json.dumps({
+        "mcpServers": {
+            "SQLite": {"command": "uvx"},
+            "git": {"command": "uvx"},
+        }
+    }))
+
+    with patch("specify_cli.mcp_discovery._mcp_config_paths", return_value={}):
+        operations = get_available_mcp_operations(temp_project)
+
+    assert list(operations) == ["database", "git"]
+    assert "execute_sql" in operations["database"]
+    assert operations["git"][0] == "status"
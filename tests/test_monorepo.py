@@ -1,6 +1,7 @@
 """Tests for monorepo detection and workspace support."""
 
 import json
+import sys
 from pathlib import Path
 import pytest
 
@@ -307,6 +308,31 @@ def test_expand_glob_patterns_deduplicate(temp_project):
     assert len(core_paths) == 1
 
 
+def test_expand_glob_patterns_deduplicate_equivalent_spellings(temp_project):
+    """Test that differently spelled patterns for one directory collapse."""
+    (temp_project / "packages" / "core").mkdir(parents=True)
+
+    patterns = ["packages/*", "./packages/core/", "packages/../packages//core"]
+    result = _expand_glob_patterns(temp_project, patterns)
+
+    assert result == [temp_project / "packages" / "core"]
+
+
+def test_expand_glob_patterns_many_roots(temp_project):
+    """Test expanding enough patterns to use the thread pool."""
+    roots = ["apps", "libs", "packages", "tools", "services"]
+    for root in roots:
+        (temp_project / root / "one").mkdir(parents=True)
+        (temp_project / root / "two").mkdir()
+
+    patterns = [f"{root}/*" for root in roots] + ["apps/one", "!tools/two"]
+    result = _expand_glob_patterns(temp_project, patterns)
+
+    assert result == sorted(
+        temp_project / root / name for root in roots for name in ("one", "two")
+    )
+
+
 def test_expand_glob_patterns_files_excluded(temp_project):
     """Test that files (not directories) are excluded."""
     (temp_project / "packages").mkdir()
@@ -321,6 +347,21 @@ def test_expand_glob_patterns_files_excluded(temp_project):
     assert result[0].name == "lib"
 
 
+def test_expand_glob_patterns_double_star_and_wildcard_segments(temp_project):
+    """Test `**` matches one level like `*` and wildcards match within a segment."""
+    (temp_project / "packages" / "a" / "node_modules" / "lodash").mkdir(parents=True)
+    (temp_project / "packages" / "b" / "src").mkdir(parents=True)
+    (temp_project / "packages" / ".cache").mkdir(parents=True)
+    (temp_project / "apps" / "web-admin").mkdir(parents=True)
+    (temp_project / "apps" / "docs").mkdir(parents=True)
+
+    double_star = _expand_glob_patterns(temp_project, ["packages/**"])
+    wildcard = _expand_glob_patterns(temp_project, ["apps/web-*"])
+
+    assert double_star == [temp_project / "packages" / "a", temp_project / "packages" / "b"]
+    assert [p.name for p in wildcard] == ["web-admin"]
+
+
 # =============================================================================
 # Edge Cases and Error Handling
 # =============================================================================
@@ -364,6 +405,59 @@ def test_get_packages_invalid_json(temp_project):
     assert "Invalid JSON" in str(exc_info.value)
 
 
+def test_get_npm_workspaces_reloads_changed_package_json(temp_project):
+    """Test cached package.json parsing is refreshed after the file changes."""
+    from specify_cli.errors import MonorepoError
+
+    (temp_project / "packages" / "core").mkdir(parents=True)
+    package_json = temp_project / "package.json"
+    package_json.write_text("{ invalid }")
+
+    for _ in range(2):
+        with pytest.raises(MonorepoError, match="Invalid JSON"):
+            _get_npm_workspaces(temp_project)
+
+    package_json.write_text(json.dumps({"workspaces": ["packages/*"]}))
+
+    assert [p.name for p in _get_npm_workspaces(temp_project)] == ["core"]
+
+
+def test_get_npm_workspaces_invalid_json_errors_not_shared(temp_project):
+    """Test repeated parses of a broken package.json raise fresh exceptions."""
+    from specify_cli.errors import MonorepoError
+
+    (temp_project / "package.json").write_text("{ invalid }")
+
+    causes = []
+    for _ in range(2):
+        with pytest.raises(MonorepoError) as exc_info:
+            _get_npm_workspaces(temp_project)
+        causes.append(exc_info.value.__cause__)
+
+    assert causes[0] is not None
+    assert causes[0] is not causes[1]
+
+
+def test_get_cargo_members_dotted_keys(temp_project):
+    """Test workspace members declared with dotted keys are found."""
+    (temp_project / "Cargo.toml").write_text('workspace.members = ["crates/*"]\n')
+    (temp_project / "crates" / "core").mkdir(parents=True)
+
+    packages = _get_cargo_members(temp_project)
+
+    assert [p.name for p in packages] == ["core"]
+
+
+def test_get_cargo_members_invalid_toml(temp_project):
+    """Test malformed Cargo workspace manifest raises MonorepoError."""
+    from specify_cli.errors import MonorepoError
+
+    (temp_project / "Cargo.toml").write_text('[workspace]\nmembers = ["crates/*"\n')
+
+    with pytest.raises(MonorepoError, match="Invalid TOML"):
+        _get_cargo_members(temp_project)
+
+
 def test_pnpm_workspace_simple_parser_fallback(temp_project):
     """Test the simple YAML parser fallback for pnpm."""
     # This would be used if yaml module isn't available
@@ -385,6 +479,30 @@ def test_pnpm_workspace_simple_parser_fallback(temp_project):
     assert len(packages) == 3
 
 
+def test_pnpm_workspace_block_list_parsed_without_yaml(temp_project, monkeypatch):
+    """Test the common pnpm workspace shape never needs PyYAML."""
+    monkeypatch.setitem(sys.modules, "yaml", None)  # Any `import yaml` fails
+    (temp_project / "pnpm-workspace.yaml").write_text(
+        "packages:\n  - 'packages/*' # libs\n\ncatalog:\n  react: ^18.0.0\n"
+    )
+    (temp_project / "packages" / "core").mkdir(parents=True)
+
+    packages = _get_pnpm_workspaces(temp_project)
+
+    assert [p.name for p in packages] == ["core"]
+
+
+def test_pnpm_workspace_flow_list_uses_yaml(temp_project):
+    """Test syntax the line parser doesn't handle falls back to PyYAML."""
+    pytest.importorskip("yaml")
+    (temp_project / "pnpm-workspace.yaml").write_text("packages: ['packages/*']\n")
+    (temp_project / "packages" / "core").mkdir(parents=True)
+
+    packages = _get_pnpm_workspaces(temp_project)
+
+    assert [p.name for p in packages] == ["core"]
+
+
 def test_expand_glob_patterns_leading_slash(temp_project):
     """Test patterns with leading slash are handled correctly."""
     (temp_project / "packages" / "lib").mkdir(parents=True)
@@ -52,6 +52,12 @@ def test_parse_ai_argument_list():
     assert "cursor-agent" in result
 
 
+def test_parse_ai_argument_whitespace_separated():
+    """Test parsing agents separated by spaces and mixed separators."""
+    result = parse_ai_argument(["Claude copilot", "gemini,  claude"])
+    assert result == ["claude", "copilot", "gemini"]
+
+
 def test_parse_ai_argument_invalid():
     """Test parsing invalid agent raises error."""
     with pytest.raises(ValueError):
@@ -108,6 +114,24 @@ def test_verify_missing_symlinks(temp_project):
     assert status["claude"] == "missing"
 
 
+def test_existing_symlink_counts_as_linked(temp_project, central_install):
+    """Test links already pointing at the source are accepted without force."""
+    agents_dir = get_agents_dir()
+    source = agents_dir / "claude" / "commands"
+    source.mkdir(parents=True, exist_ok=True)
+    (source / "test.md").touch()
+
+    assert create_agent_symlinks(temp_project, ["claude"], verbose=False)["claude"] is True
+    # Relinking the same target is a no-op success
+    assert create_agent_symlinks(temp_project, ["claude"], verbose=False)["claude"] is True
+
+    # An equivalent relative link also counts as already linked
+    link = temp_project / ".claude" / "commands"
+    link.unlink()
+    link.symlink_to(os.path.relpath(source, link.parent))
+    assert create_agent_symlinks(temp_project, ["claude"], verbose=False)["claude"] is True
+
+
 def test_force_overwrite(temp_project, central_install):
     """Test force flag overwrites existing directories."""
     agents_dir = get_agents_dir()
@@ -126,3 +150,33 @@ def test_force_overwrite(temp_project, central_install):
     results = create_agent_symlinks(temp_project, ["claude"], force=True, verbose=False)
     assert results["claude"] is True
 
+
+
+def test_copy_agent_commands_single_worker(temp_project, central_install):
+    """Test copying several agents with the worker pool disabled."""
+    agents_dir = get_agents_dir()
+    for agent in ["claude", "cursor-agent"]:
+        (agents_dir / agent.replace("-agent", "") / "commands").mkdir(parents=True, exist_ok=True)
+        (agents_dir / agent.replace("-agent", "") / "commands" / "test.md").touch()
+
+    agents = ["claude", "cursor-agent"]
+    results = create_agent_symlinks(
+        temp_project, agents, verbose=False, use_copy=True, copy_workers=1
+    )
+
+    assert results == {"claude": True, "cursor-agent": True}
+    assert (temp_project / ".claude" / "commands" / "test.md").is_file()
+    assert not (temp_project / ".claude" / "commands").is_symlink()
+
+
+def test_verbose_output_grouped_per_agent(temp_project, central_install, capsys):
+    """Test concurrent agents report their status lines in agent order."""
+    agents = ["claude", "bogus-one", "cursor-agent", "bogus-two"]
+    create_agent_symlinks(temp_project, agents, verbose=True)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(agents)
+    assert "claude" in lines[0]
+    assert "Unknown agent: bogus-one" in lines[1]
+    assert "cursor" in lines[2]
+    assert "Unknown agent: bogus-two" in lines[3]
@@ -59,6 +59,18 @@ def test_merge_json_files_nested(temp_project):
     assert result["outer"]["shared"] == "from2"
 
 
+def test_merge_json_files_does_not_mutate_new_content(temp_project):
+    """Test merging a dict leaves the caller's dict untouched."""
+    file1 = temp_project / "config1.json"
+    file1.write_text(json.dumps({"outer": {"a": 1}}))
+    new_content = {"outer": {"b": 2}}
+
+    result = merge_json_files(file1, new_content)
+
+    assert result == {"outer": {"a": 1, "b": 2}}
+    assert new_content == {"outer": {"b": 2}}
+
+
 def test_merge_json_files_arrays(temp_project):
     """Test that arrays are replaced, not merged."""
     file1 = temp_project / "config1.json"
@@ -154,6 +166,24 @@ def test_handle_vscode_settings_merge(temp_project):
     assert merged["editor.wordWrap"] == "on"  # Added
 
 
+def test_handle_vscode_settings_skips_write_when_unchanged(temp_project):
+    """Test that a no-op merge leaves the existing file untouched."""
+    vscode_dir = temp_project / ".vscode"
+    vscode_dir.mkdir()
+
+    existing = vscode_dir / "settings.json"
+    existing.write_text(json.dumps({"editor.fontSize": 14, "a": 1}, indent=4) + "\n")
+    os.utime(existing, ns=(1_000_000_000, 1_000_000_000))
+
+    template = temp_project / "template_settings.json"
+    template.write_text(json.dumps({"a": 1}))
+
+    handle_vscode_settings(template, existing, ".vscode/settings.json", verbose=False)
+
+    assert existing.stat().st_mtime_ns == 1_000_000_000
+    assert list(vscode_dir.iterdir()) == [existing]
+
+
 def test_handle_vscode_settings_no_existing(temp_project):
     """Test handling VS Code settings when .vscode doesn't exist."""
     vscode_dir = temp_project / ".vscode"
@@ -286,6 +316,42 @@ def test_download_template_from_github_success(temp_project):
         pytest.skip(f"GitHub API unavailable: {e}")
 
 
+def test_download_template_reuses_cache_on_not_modified(temp_project, monkeypatch):
+    """Test a 304 release response reuses the cached zip without downloading."""
+    import httpx
+
+    cache_dir = temp_project / "cache"
+    monkeypatch.setattr("specify_cli.template_download._template_cache_dir", lambda: cache_dir)
+    asset = {
+        "id": 1,
+        "name": "spec-kit-template-claude-sh-v1.zip",
+        "size": 4,
+        "updated_at": "2024-01-01T00:00:00Z",
+        "browser_download_url": "https://example.test/template.zip",
+    }
+    asset_downloads = []
+
+    def handler(request):
+        if request.url.host == "api.github.com":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"tag_name": "v1", "assets": [asset]}, headers={"ETag": '"v1"'})
+        asset_downloads.append(request.url)
+        return httpx.Response(200, content=b"ZIP!")
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    for run in ("first", "second"):
+        download_dir = temp_project / run
+        download_dir.mkdir()
+        zip_path, metadata = download_template_from_github(
+            "claude", download_dir, verbose=False, show_progress=False, client=client
+        )
+        assert zip_path.read_bytes() == b"ZIP!"
+        assert metadata["release"] == "v1"
+
+    assert len(asset_downloads) == 1
+
+
 @responses.activate
 def test_download_template_github_rate_limit(temp_project):
     """Test handling of GitHub rate limit errors."""
@@ -364,6 +430,58 @@ def test_template_zip_with_nested_structure(temp_project):
     assert (extract_dir / "repo-main" / ".specify" / "templates" / "spec.md").exists()
 
 
+def test_extract_into_current_dir_merges_existing_directories(temp_project, tmp_path):
+    """Test merging a template into an existing project directory tree."""
+    from specify_cli.template_download import download_and_extract_template
+
+    zip_path = tmp_path / "template.zip"
+    with zipfile.ZipFile(zip_path, 'w') as zipf:
+        zipf.writestr("repo-main/.vscode/settings.json", json.dumps({"b": 2}))
+        zipf.writestr("repo-main/.vscode/tasks/build.json", "{}")
+        zipf.writestr("repo-main/README.md", "# Template")
+
+    vscode_dir = temp_project / ".vscode"
+    vscode_dir.mkdir()
+    (vscode_dir / "settings.json").write_text(json.dumps({"a": 1}))
+    (vscode_dir / "extensions.json").write_text("[]")
+
+    meta = {"release": "v1", "size": zip_path.stat().st_size, "filename": zip_path.name}
+    with patch(
+        "specify_cli.template_download.download_template_from_github",
+        return_value=(zip_path, meta),
+    ):
+        download_and_extract_template(
+            temp_project, "claude", "sh", is_current_dir=True, verbose=False
+        )
+
+    settings = json.loads((vscode_dir / "settings.json").read_text())
+    assert settings == {"a": 1, "b": 2}
+    assert (vscode_dir / "tasks" / "build.json").read_text() == "{}"
+    assert (vscode_dir / "extensions.json").exists()
+    assert (temp_project / "README.md").read_text() == "# Template"
+
+
+def test_extract_zip_streams_members_safely(temp_project):
+    """Test streamed extraction matches extractall and stays inside dest."""
+    from specify_cli.template_download import _extract_zip
+
+    zip_path = temp_project / "template.zip"
+    with zipfile.ZipFile(zip_path, 'w') as zipf:
+        zipf.writestr("repo-main/", "")
+        zipf.writestr("repo-main/.specify/templates/spec.md", "# Spec")
+        zipf.writestr("../escape.txt", "nope")
+
+    extract_dir = temp_project / "extracted"
+    extract_dir.mkdir()
+
+    with zipfile.ZipFile(zip_path, 'r') as zipf:
+        _extract_zip(zipf, extract_dir)
+
+    assert (extract_dir / "repo-main" / ".specify" / "templates" / "spec.md").read_text() == "# Spec"
+    assert (extract_dir / "escape.txt").read_text() == "nope"
+    assert not (temp_project / "escape.txt").exists()
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -1,5 +1,6 @@
 """Tests for Windows-specific functionality and cross-platform compatibility."""
 
+import os
 import platform
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -8,7 +9,7 @@ import pytest
 from specify_cli.symlink_manager import (
     _has_windows_symlink_capability,
     _copy_agent_commands,
-    _copy_file,
+    copy_file,
     _copy_directory,
     create_agent_symlinks,
 )
@@ -19,6 +20,14 @@ from specify_cli.symlink_manager import (
 # =============================================================================
 
 
+@pytest.fixture
+def fresh_symlink_capability():
+    """Clear the memoized symlink capability probe around a test."""
+    _has_windows_symlink_capability.cache_clear()
+    yield
+    _has_windows_symlink_capability.cache_clear()
+
+
 @pytest.mark.skipif(platform.system() != "Windows", reason="Windows-specific test")
 def test_windows_symlink_capability_check():
     """Test Windows symlink capability detection."""
@@ -29,21 +38,21 @@ def test_windows_symlink_capability_check():
 
 
 @pytest.mark.skipif(platform.system() == "Windows", reason="Non-Windows test")
-def test_non_windows_always_has_symlink_capability():
+def test_non_windows_always_has_symlink_capability(fresh_symlink_capability):
     """Test that non-Windows systems always return True for symlink capability."""
     assert _has_windows_symlink_capability() is True
 
 
-def test_windows_symlink_capability_with_mocked_failure():
+def test_windows_symlink_capability_with_mocked_failure(fresh_symlink_capability):
     """Test symlink capability detection when symlink creation fails."""
-    with patch("platform.system", return_value="Windows"):
+    with patch("specify_cli.symlink_manager._IS_WINDOWS", True):
         with patch("pathlib.Path.symlink_to", side_effect=OSError):
             assert _has_windows_symlink_capability() is False
 
 
-def test_windows_symlink_capability_with_mocked_success():
+def test_windows_symlink_capability_with_mocked_success(fresh_symlink_capability):
     """Test symlink capability detection when symlink creation succeeds."""
-    with patch("platform.system", return_value="Windows"):
+    with patch("specify_cli.symlink_manager._IS_WINDOWS", True):
         # Mock symlink_to to succeed
         with patch("pathlib.Path.symlink_to"):
             # Mock unlink for cleanup
@@ -63,7 +72,7 @@ def test_copy_file_basic(temp_project):
 
     target = temp_project / "target.txt"
 
-    result = _copy_file(source, target, force=False, verbose=False)
+    result = copy_file(source, target, force=False, verbose=False)
 
     assert result is True
     assert target.exists()
@@ -78,7 +87,7 @@ def test_copy_file_existing_without_force(temp_project):
     target = temp_project / "target.txt"
     target.write_text("existing content")
 
-    result = _copy_file(source, target, force=False, verbose=False)
+    result = copy_file(source, target, force=False, verbose=False)
 
     assert result is False
     assert target.read_text() == "existing content"  # Unchanged
@@ -92,12 +101,30 @@ def test_copy_file_existing_with_force(temp_project):
     target = temp_project / "target.txt"
     target.write_text("old content")
 
-    result = _copy_file(source, target, force=True, verbose=False)
+    result = copy_file(source, target, force=True, verbose=False)
 
     assert result is True
     assert target.read_text() == "new content"
 
 
+@pytest.mark.skipif(platform.system() == "Windows", reason="POSIX permission bits")
+def test_copy_file_preserves_mode_and_mtime(temp_project):
+    """Test that single-file copies keep permission bits and timestamps."""
+    source = temp_project / "run.sh"
+    source.write_text("#!/bin/sh\n")
+    source.chmod(0o755)
+    os.utime(source, ns=(1_000_000_000, 2_000_000_000))
+
+    target = temp_project / "copy.sh"
+
+    result = copy_file(source, target, force=False, verbose=False)
+
+    assert result is True
+    assert target.read_text() == "#!/bin/sh\n"
+    assert target.stat().st_mode & 0o777 == 0o755
+    assert target.stat().st_mtime_ns == 2_000_000_000
+
+
 def test_copy_directory_basic(temp_project):
     """Test basic directory copying functionality."""
     source = temp_project / "source_dir"
@@ -116,6 +143,64 @@ def test_copy_directory_basic(temp_project):
     assert (target / "file2.txt").read_text() == "content2"
 
 
+def test_copy_directory_nested(temp_project):
+    """Test directory copying recurses and keeps permission bits."""
+    source = temp_project / "source_dir"
+    (source / "sub" / "deeper").mkdir(parents=True)
+    (source / "sub" / "deeper" / "cmd.md").write_text("nested")
+    script = source / "sub" / "run.sh"
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+
+    target = temp_project / "target_dir"
+
+    result = _copy_directory(source, target, force=False, verbose=False)
+
+    assert result is True
+    assert (target / "sub" / "deeper" / "cmd.md").read_text() == "nested"
+    assert (target / "sub" / "run.sh").stat().st_mode & 0o111
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="in-kernel copy path is Linux-only")
+def test_copy_directory_kernel_copy_fallback(temp_project):
+    """Test directory copying still works when in-kernel copies are unsupported."""
+    source = temp_project / "source_dir"
+    source.mkdir()
+    (source / "cmd.md").write_text("content")
+    large = os.urandom(256 * 1024)
+    (source / "large.bin").write_bytes(large)
+
+    target = temp_project / "target_dir"
+
+    with patch(
+        "specify_cli.symlink_manager._KERNEL_COPIERS",
+        [MagicMock(side_effect=OSError("unsupported"))] * 2,
+    ), patch("specify_cli.symlink_manager._try_reflink", return_value=False):
+        result = _copy_directory(source, target, force=False, verbose=False)
+
+    assert result is True
+    assert (target / "cmd.md").read_text() == "content"
+    assert (target / "large.bin").read_bytes() == large
+
+
+def test_copy_directory_many_files(temp_project):
+    """Test copying a tree wide and large enough to use the thread pool."""
+    source = temp_project / "source_dir"
+    for i in range(40):
+        sub = source / f"group{i % 8}" / f"part{i % 3}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"cmd{i}.md").write_text(f"command {i}")
+
+    target = temp_project / "target_dir"
+
+    result = _copy_directory(source, target, force=False, verbose=False)
+
+    assert result is True
+    copied = sorted(p.relative_to(target) for p in target.rglob("*.md"))
+    assert copied == sorted(p.relative_to(source) for p in source.rglob("*.md"))
+    assert (target / "group5" / "part2" / "cmd5.md").read_text() == "command 5"
+
+
 def test_copy_directory_existing_without_force(temp_project):
     """Test that directory copy fails when target exists and force=False."""
     source = temp_project / "source_dir"
@@ -148,6 +233,26 @@ def test_copy_directory_existing_with_force(temp_project):
     assert not (target / "old_file.txt").exists()  # Old dir replaced
 
 
+def test_copy_directory_force_leaves_no_staging(temp_project):
+    """Test that a forced directory replace cleans up its staging and old trees."""
+    from specify_cli import symlink_manager
+
+    source = temp_project / "source_dir"
+    source.mkdir()
+    (source / "new_file.txt").write_text("new content")
+
+    target = temp_project / "target_dir"
+    target.mkdir()
+    (target / "old_file.txt").write_text("old content")
+
+    result = _copy_directory(source, target, force=True, verbose=False)
+    symlink_manager._cleanup_pool.shutdown(wait=True)
+    symlink_manager._cleanup_pool = None
+
+    assert result is True
+    assert sorted(p.name for p in temp_project.iterdir()) == ["source_dir", "target_dir"]
+
+
 def test_copy_agent_commands_integration(temp_project, mock_central_install):
     """Test full agent command copying workflow."""
     # Mock central installation with agent directories
@@ -242,7 +347,7 @@ def test_copy_preserves_file_metadata(temp_project):
     time.sleep(0.1)
 
     target = temp_project / "target.txt"
-    _copy_file(source, target, force=False, verbose=False)
+    copy_file(source, target, force=False, verbose=False)
 
     # On Unix-like systems, check that permissions are preserved
     if platform.system() != "Windows":
@@ -264,6 +369,25 @@ def test_windows_symlink_error_message_includes_recovery_options():
     assert "Developer Mode" in _create_windows_symlink.__doc__
 
 
+def test_windows_junction_fallback_avoids_subprocess(temp_project):
+    """Test the junction fallback uses _winapi.CreateJunction instead of mklink."""
+    from specify_cli.symlink_manager import _create_windows_symlink
+
+    source = temp_project / "source_dir"
+    source.mkdir()
+    target = temp_project / "link"
+    fake_winapi = MagicMock()
+
+    with patch("os.symlink", side_effect=OSError("privilege not held")), \
+            patch.dict("sys.modules", {"_winapi": fake_winapi}), \
+            patch("subprocess.run") as mock_run:
+        result = _create_windows_symlink(source, target, verbose=False)
+
+    assert result is True
+    fake_winapi.CreateJunction.assert_called_once_with(str(source), str(target))
+    mock_run.assert_not_called()
+
+
 def test_copy_fallback_mentioned_in_help():
     """Test that --copy flag is mentioned in help text."""
     from specify_cli.commands.init_cmd import init